@@ -1,4 +1,5 @@
 import sys
+import logging
 import pygame
 import traceback
 from typing import NoReturn
@@ -35,6 +36,12 @@ def main() -> NoReturn:
         config: GameConfig = GameConfig.load()
         print(f"Configuration loaded: {config.ai_count} AI, {config.difficulty.value} difficulty")
 
+        # Turn and battle details are only logged in verbose mode
+        logging.basicConfig(
+            level=logging.DEBUG if config.verbose else logging.INFO,
+            format="%(message)s"
+        )
+
         # Initialize the main game
         game: Game = Game(config)
 
@@ -5,7 +5,7 @@ from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from src.utils.config import GameConfig, Difficulty
-from src.game.state import GameState, Region
+from src.game.state import GameState, Region, RegionType
 from src.trivia.question import Question, QuestionType
 from src.ai.difficulty import AIDifficultyManager
 
@@ -33,7 +33,8 @@ class StrategicAI:
             Numeric answer
         """
         # Simulate thinking time
-        time.sleep(think_time)
+        if think_time > 0:
+            time.sleep(think_time)
 
         correct_answer = float(question.correct_answer)
 
@@ -96,7 +97,8 @@ class StrategicAI:
             Selected option text
         """
         # Simulate thinking time
-        time.sleep(think_time)
+        if think_time > 0:
+            time.sleep(think_time)
 
         # Get accuracy based on difficulty
         accuracy = self.config.get_ai_accuracy("multiple_choice")
@@ -173,16 +175,18 @@ class StrategicAI:
             # 5. Expansion toward opponents (medium difficulty and above)
             if self.config.difficulty.value != "easy":
                 # Find closest opponent capital
-                closest_opponent_distance = float('inf')
+                # Track the squared distance and take the root once for the closest
+                closest_opponent_distance_sq = float('inf')
                 for opp_id, opp_player in self.game_state.players.items():
                     if opp_id != self.player_id and opp_player.capital_region_id:
                         opp_capital_id = opp_player.capital_region_id
                         if opp_capital_id in self.game_state.regions:
                             opp_capital = self.game_state.regions[opp_capital_id]
-                            distance = self._calculate_distance(region.position, opp_capital.position)
-                            closest_opponent_distance = min(closest_opponent_distance, distance)
+                            distance_sq = self._calculate_distance_sq(region.position, opp_capital.position)
+                            closest_opponent_distance_sq = min(closest_opponent_distance_sq, distance_sq)
 
-                if closest_opponent_distance < float('inf'):
+                if closest_opponent_distance_sq < float('inf'):
+                    closest_opponent_distance = closest_opponent_distance_sq ** 0.5
                     # Normalize: closer to opponent = higher score (aggressive play)
                     max_dist = 1000
                     opp_distance_score = (max_dist - min(closest_opponent_distance, max_dist)) / max_dist
@@ -239,7 +243,7 @@ class StrategicAI:
             score += region.point_value / 1000.0  # Normalize by 1000
 
             # 2. Capital bonus (high priority)
-            if region.region_type.name == "CAPITAL":  # Check if it's a capital
+            if region.region_type == RegionType.CAPITAL:
                 score += 5.0
 
             # 3. Defensive weakness: unfortified regions are easier
@@ -307,7 +311,7 @@ class StrategicAI:
             score += region.point_value / 1000.0
 
             # 2. Capital protection (high priority)
-            if region.region_type.name == "CAPITAL":
+            if region.region_type == RegionType.CAPITAL:
                 score += 3.0
 
             # 3. Border regions need more protection
@@ -365,7 +369,20 @@ class StrategicAI:
         Returns:
             Distance
         """
-        return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
+        return self._calculate_distance_sq(pos1, pos2) ** 0.5
+
+    def _calculate_distance_sq(self, pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
+        """
+        Calculate squared Euclidean distance between two points.
+
+        Args:
+            pos1: First position (x, y)
+            pos2: Second position (x, y)
+
+        Returns:
+            Squared distance
+        """
+        return (pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2
 
 
 # Test the AI
@@ -1,9 +1,12 @@
 from __future__ import annotations
 import pygame
+import logging
+import os
 import random
 import time
-from typing import Dict, List, Optional, Tuple, Any
-from enum import Enum, auto
+import numpy as np
+from typing import Dict, List, Optional, Set, Tuple, Any
+from enum import IntEnum, auto
 
 from src.utils.config import GameConfig
 from src.game.state import (
@@ -18,21 +21,52 @@ from src.map.map_manager import MapManager
 from src.ai.strategic_ai import StrategicAI
 from src.ai.difficulty import AIDifficultyManager
 from src.utils.sound_manager import SoundManager
+from src.utils.helpers import wrap_text
 
+logger = logging.getLogger(__name__)
 
-class TurnAction(Enum):
+
+class TurnAction(IntEnum):
     """Possible actions a player can take during their turn."""
     NONE = auto()
     FORTIFY = auto()
     ATTACK = auto()
 
 
+def _rank_answers(answers: np.ndarray, times: np.ndarray, correct: float) -> np.ndarray:
+    """
+    Rank numeric answers by closeness to the correct value, then by answer time.
+
+    Args:
+        answers: Answers as floats (NaN for answers that are not numbers)
+        times: Answer timestamps, same order as answers
+        correct: The correct answer
+
+    Returns:
+        Indices into answers in ranking order (stable for full ties)
+    """
+    diffs = np.abs(answers - correct)
+    diffs[np.isnan(diffs)] = np.inf
+    return np.lexsort((times, diffs))
+
+
 class Game:
     """
     Main game controller that orchestrates all game components.
     Manages the game loop, state transitions, and player interactions.
     """
 
+    # Blocking wait loops sleep until input arrives, redrawing at least this often
+    WAIT_LOOP_EVENT_TIMEOUT_MS = 100
+    WAIT_LOOP_REDRAW_INTERVAL = 0.5  # seconds
+    WAIT_LOOP_FPS = 100  # Redraw cap while input keeps arriving
+
+    # Click radius around region centers, also the cell size of the region grid
+    REGION_CLICK_RADIUS = 30
+
+    # Pixels per unit of config.min_capital_distance
+    CAPITAL_DISTANCE_SCALE = 50.0
+
     def __init__(self, config: GameConfig):
         """
         Initialize the game with given configuration.
@@ -63,29 +97,28 @@ class Game:
         self.selectable_region_ids: List[int] = []
         self.selected_region_id: Optional[int] = None
         self.current_selection_player: Optional[int] = None
+        self._has_human: bool = True  # Set in setup_players
 
         #Occupation regions
         self.clickable_occupation_regions = []
 
-        # AI system
-        self.ai_manager = AIDifficultyManager(config)
+        # AI system (controllers are built on first use, see _get_ai_controller)
+        self._ai_manager: Optional[AIDifficultyManager] = None
         self.ai_players: Dict[int, StrategicAI] = {}
 
-        # Load questions from JSON file
-        import os
-        self.questions: List[Question] = []
-        json_questions_path = 'data/questions.json'
-        if os.path.exists(json_questions_path):
-            try:
-                self.questions = QuestionLoader.load_from_json(json_questions_path)
-                print(f"Loaded {len(self.questions)} questions from {json_questions_path}")
-            except Exception as e:
-                print(f"Warning: Could not load questions from {json_questions_path}: {e}")
-                self.questions = []
+        # Questions are read from data/questions.json on first access
+        self._questions: Optional[List[Question]] = None
+
+        # Shuffled question pools per filter, dealt in order by a cursor
+        self._question_pools: Dict[Tuple[Any, ...], List[Question]] = {}
+        self._question_cursors: Dict[Tuple[Any, ...], int] = {}
 
         # Map manager
         self.map_manager = MapManager()
 
+        # Spatial grid of region ids for click hit-testing, built in setup_regions
+        self._region_grid: Dict[Tuple[int, int], List[int]] = {}
+
         # Menu/Setup screen (type hint at module level to avoid circular imports)
         self.menu_screen: Any = None  # Will be initialized in setup_display
         self.game_settings_confirmed = False
@@ -93,11 +126,17 @@ class Game:
         # Turn phase
         self.turn_order: List[int] = []
         self.current_player_index: int = 0
-        self.selected_action: Optional[str] = None  # "fortify" or "attack"
+        self.selected_action: Optional[TurnAction] = None
         self.available_actions: Dict[str, List[int]] = {"attack": [], "fortify": []}
 
         # Current turn state
         self.current_action: TurnAction = TurnAction.NONE
+
+        # Turn action handlers, chosen once per action instead of string matching
+        self._action_handlers = {
+            TurnAction.ATTACK: self._execute_attack_action,
+            TurnAction.FORTIFY: self._execute_fortify_action,
+        }
         self.last_click_time: float = 0
         self.click_cooldown: float = 0.3  # seconds between clicks
 
@@ -105,12 +144,15 @@ class Game:
         self.message_text: str = ""
         self.message_timer: float = 0
         self.message_duration: float = 2.0  # seconds
+        self._dirty: bool = True  # Input arrived since the last redraw
+        self._last_wait_redraw: float = 0
 
         # Battle state
         self.battle_question: Optional[Question] = None
         self.battle_answers: Dict[int, Any] = {}  # player_id -> answer
         self.battle_answer_times: Dict[int, float] = {}  # player_id -> time
         self.battle_start_time: float = 0
+        self._question_surface: Optional[pygame.Surface] = None  # Wrapped question text
 
         # Initialize game objects
         self.setup_display()
@@ -118,6 +160,51 @@ class Game:
         self.state.current_phase = GamePhase.SETUP
         # Players and regions will be initialized after setup screen is confirmed
 
+    @property
+    def questions(self) -> List[Question]:
+        """Trivia questions, loaded from data/questions.json on first access."""
+        if self._questions is None:
+            self._questions = []
+            json_questions_path = 'data/questions.json'
+            if os.path.exists(json_questions_path):
+                try:
+                    self._questions = QuestionLoader.load_from_json(json_questions_path)
+                    print(f"Loaded {len(self._questions)} questions from {json_questions_path}")
+                except Exception as e:
+                    print(f"Warning: Could not load questions from {json_questions_path}: {e}")
+        return self._questions
+
+    @property
+    def ai_manager(self) -> AIDifficultyManager:
+        """Difficulty manager shared by all AI controllers, created on first use."""
+        if self._ai_manager is None:
+            self._ai_manager = AIDifficultyManager(self.config)
+        return self._ai_manager
+
+    def _get_ai_controller(self, player_id: int) -> Optional[StrategicAI]:
+        """
+        Get the AI controller for a player, creating it on first use.
+
+        Args:
+            player_id: ID of the player
+
+        Returns:
+            The player's StrategicAI, or None if the player is not AI-controlled
+        """
+        ai = self.ai_players.get(player_id)
+        if ai is None:
+            player = self.state.players.get(player_id)
+            if player is None or player.player_type != PlayerType.AI:
+                return None
+            ai = StrategicAI(
+                player_id=player_id,
+                config=self.config,
+                game_state=self.state,
+                ai_manager=self.ai_manager
+            )
+            self.ai_players[player_id] = ai
+        return ai
+
     def setup_display(self) -> None:
         """Initialize Pygame display and screen manager."""
         if self.config.fullscreen:
@@ -139,6 +226,34 @@ class Game:
         from src.ui.menu_screen import MenuScreen
         self.menu_screen = MenuScreen(self.screen, self.config)
 
+        # Fonts and static text for the open answer interface
+        font_name = self.config.font_name
+        self._font_body = pygame.font.SysFont(font_name, self.config.font_sizes["body"])
+        self._font_heading = pygame.font.SysFont(font_name, self.config.font_sizes["heading"])
+        self._font_small = pygame.font.SysFont(font_name, self.config.font_sizes["small"])
+
+        instructions = [
+            "Enter numbers with keyboard or numpad",
+            "BACKSPACE: delete last digit",
+            "ENTER: submit answer",
+            "-: toggle negative sign",
+            "ESC: cancel"
+        ]
+        # Pre-render the instruction block onto one surface, a line every 25 pixels
+        line_surfaces = [
+            self._font_small.render(inst, True, self.config.colors.text_secondary)
+            for inst in instructions
+        ]
+        line_height = max(surf.get_height() for surf in line_surfaces)
+        self._instructions_surface = pygame.Surface(
+            (max(surf.get_width() for surf in line_surfaces),
+             25 * (len(line_surfaces) - 1) + line_height),
+            pygame.SRCALPHA
+        )
+        for i, surf in enumerate(line_surfaces):
+            self._instructions_surface.blit(surf, (0, 25 * i + (line_height - surf.get_height()) // 2))
+        self._instructions_offset = line_height // 2
+
         # Load sounds
         if self.sound_manager:
             self.sound_manager.load_sounds(self.config.assets_dir)
@@ -175,12 +290,12 @@ class Game:
 
     def setup_players(self) -> None:
         """Initialize all players (human + AI)."""
-        # Human player (always player 0)
+        # Human player (always player 0, AI-controlled in headless simulations)
         player_name = getattr(self, 'player_name', 'Player')
         human_player = Player(
             player_id=0,
             name=player_name,
-            player_type=PlayerType.HUMAN,
+            player_type=PlayerType.AI if self.config.headless else PlayerType.HUMAN,
             color=self.config.get_player_color(0),
             score=self.config.starting_score
         )
@@ -199,15 +314,13 @@ class Game:
             )
             self.state.add_player(ai_player)
 
-            # Create AI controller
-            self.ai_players[player_id] = StrategicAI(
-                player_id=player_id,
-                config=self.config,
-                game_state=self.state,
-                ai_manager=self.ai_manager
-            )
+        # Without a human player the UI wait loops can be skipped entirely
+        self._has_human = any(
+            player.player_type == PlayerType.HUMAN for player in self.state.players.values()
+        )
 
-        print(f"Setup {total_players} players (1 human + {self.config.ai_count} AI)")
+        human_count = 1 if self._has_human else 0
+        print(f"Setup {total_players} players ({human_count} human + {total_players - human_count} AI)")
 
     def setup_regions(self) -> None:
         """Generate and setup all regions on the map."""
@@ -227,12 +340,24 @@ class Game:
             )
             self.state.add_region(region)
 
+        self._build_region_grid()
         print(f"Generated {len(regions_data)} regions")
 
         # Start with spawning phase
         self.state.current_phase = GamePhase.SPAWNING
         self.start_spawning_phase()
 
+    def _build_region_grid(self) -> None:
+        """Bucket region ids into grid cells the size of the click radius."""
+        cell_size = self.REGION_CLICK_RADIUS
+        grid: Dict[Tuple[int, int], List[int]] = {}
+
+        for region_id, region in self.state.regions.items():
+            x, y = region.position
+            grid.setdefault((int(x // cell_size), int(y // cell_size)), []).append(region_id)
+
+        self._region_grid = grid
+
     def _filter_questions(self, categories: Optional[List[str]] = None,
                          question_type: Optional[QuestionType] = None,
                          difficulty: Optional[int] = None) -> List[Question]:
@@ -266,6 +391,9 @@ class Game:
         """
         Get a random question matching criteria.
 
+        Matching questions are shuffled once and dealt in order, so no
+        question repeats until the whole pool has been used.
+
         Args:
             categories: List of categories to include (None = all categories)
             question_type: Type of question (None = any type)
@@ -274,12 +402,27 @@ class Game:
         Returns:
             Random question or None if no matches
         """
-        filtered = self._filter_questions(categories, question_type, difficulty)
+        key = (tuple(categories) if categories else None, question_type, difficulty)
+        pool = self._question_pools.get(key)
 
-        if not filtered:
+        if pool is None:
+            # First request for this filter: build and shuffle its pool
+            pool = list(self._filter_questions(categories, question_type, difficulty))
+            random.shuffle(pool)
+            self._question_pools[key] = pool
+            self._question_cursors[key] = 0
+
+        if not pool:
             return None
 
-        return random.choice(filtered)
+        index = self._question_cursors[key]
+        if index >= len(pool):
+            # Pool exhausted, start a new shuffled round
+            random.shuffle(pool)
+            index = 0
+
+        self._question_cursors[key] = index + 1
+        return pool[index]
 
     def _get_multiple_choice_question(self, categories: Optional[List[str]] = None,
                                      difficulty: Optional[int] = None) -> Optional[Question]:
@@ -359,6 +502,13 @@ class Game:
             reverse=True
         )
 
+        # AI-only simulations have no score to record and nobody to click "New Game"
+        if not self._has_human:
+            for position, (player_id, player) in enumerate(standings, 1):
+                logger.info("%d. %s - %d points", position, player.name, player.score)
+            self.running = False
+            return
+
         # Find human player and save their score
         human_player = self.state.players.get(0)
         if human_player:
@@ -511,24 +661,7 @@ class Game:
                 question_y = 150
 
                 # Wrap question text
-                words = question_text.split()
-                lines = []
-                current_line = []
-
-                for word in words:
-                    current_line.append(word)
-                    line_text = ' '.join(current_line)
-                    if question_font.size(line_text)[0] > self.config.screen_width - 100:
-                        if len(current_line) > 1:
-                            current_line.pop()
-                            lines.append(' '.join(current_line))
-                            current_line = [word]
-                        else:
-                            lines.append(line_text)
-                            current_line = []
-
-                if current_line:
-                    lines.append(' '.join(current_line))
+                lines = self.wrap_text(question_text, question_font, self.config.screen_width - 100)
 
                 for i, line in enumerate(lines):
                     line_surf = question_font.render(line, True, self.config.colors.text_primary)
@@ -666,8 +799,10 @@ class Game:
         """Reset the game to allow a new game to be played."""
         print("\n=== RESETTING GAME ===")
 
-        # Reset game state
+        # Reset game state (AI controllers are rebuilt lazily against it)
         self.state = GameState()
+        self.logic = GameLogic(self.state, self.config)
+        self.ai_players.clear()
 
         # Reset settings confirmation
         self.game_settings_confirmed = False
@@ -680,36 +815,40 @@ class Game:
 
     def start_spawning_phase(self) -> None:
         """Start the capital spawning phase."""
-        available_regions = list(self.state.regions.keys())
-        players_to_spawn = [pid for pid in self.state.players.keys()]
+        region_ids, positions, _ = self.state.get_region_arrays()
+        available = np.ones(len(region_ids), dtype=bool)
+        players_to_spawn = list(self.state.players)
 
         # Shuffle players for random spawn order
         random.shuffle(players_to_spawn)
 
-        spawned_capitals: List[int] = []
+        # Compare squared distances to skip the sqrt
+        min_distance_sq = (self.config.min_capital_distance * self.CAPITAL_DISTANCE_SCALE) ** 2
+
+        # Positions of placed capitals, filled in as they spawn
+        capital_positions = np.empty((len(players_to_spawn), 2), dtype=np.float64)
+        spawned_count = 0
 
         for player_id in players_to_spawn:
+            available_indices = np.flatnonzero(available)
+            candidate_indices = available_indices
+
             # Filter regions that are far enough from existing capitals
-            candidate_regions = [
-                rid for rid in available_regions
-                if all(
-                    self.logic.calculate_distance(
-                        self.state.regions[rid].position,
-                        self.state.regions[other_rid].position
-                    ) >= self.config.min_capital_distance * 50  # Scale factor
-                    for other_rid in spawned_capitals
-                )
-            ]
+            if spawned_count:
+                diff = positions[available_indices][:, None, :] - capital_positions[None, :spawned_count, :]
+                distances_sq = (diff * diff).sum(axis=-1)
+                candidate_indices = available_indices[(distances_sq >= min_distance_sq).all(axis=1)]
 
-            if not candidate_regions:
+            if not candidate_indices.size:
                 # Fallback: any available region
-                candidate_regions = available_regions
+                candidate_indices = available_indices
 
-            if candidate_regions:
-                capital_region_id = random.choice(candidate_regions)
-                self.place_capital(player_id, capital_region_id)
-                spawned_capitals.append(capital_region_id)
-                available_regions.remove(capital_region_id)
+            if candidate_indices.size:
+                index = int(candidate_indices[random.randrange(candidate_indices.size)])
+                self.place_capital(player_id, int(region_ids[index]))
+                capital_positions[spawned_count] = positions[index]
+                spawned_count += 1
+                available[index] = False
 
         # Move to occupation phase
         self.state.current_phase = GamePhase.OCCUPYING
@@ -718,8 +857,8 @@ class Game:
     def place_capital(self, player_id: int, region_id: int) -> None:
         """Place a capital for a player in a region."""
         region = self.state.regions[region_id]
+        self.state.set_region_owner(region_id, player_id)
         region.region_type = RegionType.CAPITAL
-        region.owner_id = player_id
         region.point_value = self.config.capital_points
         region.original_owner = player_id
 
@@ -765,14 +904,14 @@ class Game:
                 # Human will answer through UI
                 continue
 
-            # AI answers
+            # AI answers; its answer time is the question start plus its simulated think time
             think_time = self.config.get_ai_think_time() / 1000.0
-            answer = self.ai_players[player_id].answer_open_question(
+            answer = self._get_ai_controller(player_id).answer_open_question(
                 question,
                 think_time
             )
             self.battle_answers[player_id] = answer
-            self.battle_answer_times[player_id] = time.time()
+            self.battle_answer_times[player_id] = self.battle_start_time + think_time
 
         print(f"Occupation question: {question.text}")
 
@@ -781,41 +920,40 @@ class Game:
         if not self.battle_question:
             return []
 
-        # Collect all answers
-        all_answers: List[Tuple[int, Any, float]] = []  # (player_id, answer, time)
+        # Collect all answers, converted to floats once
+        player_ids: List[int] = []
+        answers: List[float] = []
+        times: List[float] = []
 
-        for player_id, _ in self.state.players.items():
+        for player_id in self.state.players:
             if player_id in self.battle_answers:
-                answer = self.battle_answers[player_id]
-                answer_time = self.battle_answer_times.get(player_id, float('inf'))
-                all_answers.append((player_id, answer, answer_time))
+                try:
+                    answer = float(self.battle_answers[player_id])
+                except (ValueError, TypeError):
+                    answer = float('nan')
+                player_ids.append(player_id)
+                answers.append(answer)
+                times.append(self.battle_answer_times.get(player_id, float('inf')))
 
         # Rank by closeness to correct answer, then by speed
-        correct_answer = float(self.battle_question.correct_answer)
-
-        def closeness_key(item: Tuple[int, Any, float]) -> Tuple[float, float]:
-            _, answer, answer_time = item
-            try:
-                diff = abs(float(answer) - correct_answer)
-            except (ValueError, TypeError):
-                diff = float('inf')
-            return (diff, answer_time)
-
-        sorted_answers = sorted(all_answers, key=closeness_key)
+        order = _rank_answers(
+            np.array(answers, dtype=np.float64),
+            np.array(times, dtype=np.float64),
+            float(self.battle_question.correct_answer)
+        )
 
         # Extract player IDs in ranking order
-        ranking = [item[0] for item in sorted_answers]
+        ranking = [player_ids[i] for i in order]
 
         print(f"Occupation ranking: {ranking}")
         return ranking
 
     def occupation_phase(self) -> None:
         """Occupation phase."""
-        # Get all unoccupied regions
-        unoccupied_regions: List[int] = [
-            rid for rid, region in self.state.regions.items()
-            if region.owner_id is None
-        ]
+        # Get all unoccupied regions (kept up to date as regions are taken)
+        unoccupied_regions: Set[int] = set(self.state.get_region_ids_by_owner(None))
+        # Fallback ranking when nobody answered (players don't change during occupation)
+        fallback_ranking = list(self.state.players)
 
         while unoccupied_regions:
             # Ask question
@@ -832,28 +970,28 @@ class Game:
             # Get ranking for asked question
             ranking = self.process_occupation_ranking()
             if not ranking:
-                ranking = list(self.state.players.keys())  # Fallback
+                ranking = fallback_ranking
 
             self.state.occupation_ranking = ranking
 
             # First place takes region
             first_player_id = ranking[0]
-            if self.take_occupation_region(first_player_id, unoccupied_regions):
-                unoccupied_regions = [rid for rid in unoccupied_regions
-                                    if self.state.regions[rid].owner_id is None]
+            taken, region_id = self.take_occupation_region(first_player_id, unoccupied_regions)
+            if taken:
+                unoccupied_regions.discard(region_id)
 
             # First place takes another region (if exists)
             if len(unoccupied_regions) > 0:
-                if self.take_occupation_region(first_player_id, unoccupied_regions):
-                    unoccupied_regions = [rid for rid in unoccupied_regions
-                                        if self.state.regions[rid].owner_id is None]
+                taken, region_id = self.take_occupation_region(first_player_id, unoccupied_regions)
+                if taken:
+                    unoccupied_regions.discard(region_id)
 
             # Second place takes region (if exists)
             if len(unoccupied_regions) > 0:
                 second_player_id = ranking[1]
-                if self.take_occupation_region(second_player_id, unoccupied_regions):
-                    unoccupied_regions = [rid for rid in unoccupied_regions
-                                        if self.state.regions[rid].owner_id is None]
+                taken, region_id = self.take_occupation_region(second_player_id, unoccupied_regions)
+                if taken:
+                    unoccupied_regions.discard(region_id)
 
         # Switch phase
         self.turn_phase()
@@ -865,12 +1003,16 @@ class Game:
         Returns:
             Human's answer as float, or None if something went wrong
         """
+        if not self._has_human:
+            return None
+
         print("Waiting for human answer...")
 
         # Set up question screen state
         self.human_answer_value = None
         self.waiting_for_human_answer = True
         self.current_question_screen = "occupation"
+        self._question_surface = None  # Re-rendered for the new question
 
         # Show the question screen
         if self.screen_manager and self.battle_question:
@@ -883,8 +1025,7 @@ class Game:
         # Wait for answer in the game loop
         start_time = time.time()
         while self.waiting_for_human_answer:
-            # Handle events
-            self.handle_events()
+            self._wait_frame()
 
             # Check for timeout
             elapsed = time.time() - start_time
@@ -893,37 +1034,33 @@ class Game:
                 self.waiting_for_human_answer = False
                 return None
 
-            # Update and draw
-            self.update()
-            self.draw()
-
-            # Small delay to prevent CPU overuse
-            pygame.time.delay(10)
-
         # Return the collected answer
         return self.human_answer_value
 
-    def take_occupation_region(self, player_id: int, available_region_ids: List[int]) -> bool:
+    def take_occupation_region(self, player_id: int,
+                               available_region_ids: Set[int]) -> Tuple[bool, Optional[int]]:
         """
         Have a player take a region during occupation phase.
 
         Args:
             player_id: ID of player taking the region
-            available_region_ids: List of unoccupied region IDs
+            available_region_ids: Set of unoccupied region IDs
 
         Returns:
-            True if region was taken, False otherwise
+            Tuple of (True if region was taken, ID of the chosen region or None)
         """
         if not available_region_ids:
-            return False
+            return False, None
 
         player = self.state.players.get(player_id)
         if not player:
             print(f"Error: Player {player_id} not found")
-            return False
+            return False, None
+
+        regions = self.state.regions
 
         # Get available regions as Region objects
-        available_regions = [self.state.regions[rid] for rid in available_region_ids]
+        available_regions = [regions[rid] for rid in available_region_ids]
 
         # Get adjacent regions for this player
         adjacent_regions, any_regions = self.state.get_available_regions_for_occupation(player_id)
@@ -948,21 +1085,23 @@ class Game:
                 region_id = chosen_region.region_id
         else:
             # AI player chooses automatically
-            ai = self.ai_players.get(player_id)
+            ai = self._get_ai_controller(player_id)
             if ai and hasattr(ai, 'choose_occupation_region'):
                 chosen_region = ai.choose_occupation_region(clickable_regions)
             else:
                 # Simple AI: choose closest to capital or random
-                if player.capital_region_id and player.capital_region_id in self.state.regions:
-                    capital_pos = self.state.regions[player.capital_region_id].position
-                    chosen_region = min(clickable_regions,
-                                       key=lambda r: self.logic.calculate_distance(r.position, capital_pos))
+                if player.capital_region_id and player.capital_region_id in regions:
+                    # Nearest candidate, measured over the cached region positions
+                    _, _, region_index = self.state.get_region_arrays()
+                    candidate_rows = [region_index[r.region_id] for r in clickable_regions]
+                    distances = self.state.distances_from(player.capital_region_id)[candidate_rows]
+                    chosen_region = clickable_regions[int(np.argmin(distances))]
                 else:
                     chosen_region = random.choice(clickable_regions)
             region_id = chosen_region.region_id
 
         # Occupy the region
-        return self.occupy_region_for_player(player_id, region_id)
+        return self.occupy_region_for_player(player_id, region_id), region_id
 
     def get_human_region_choice(self, player_id:int, available_regions: List[Region]) -> Optional[int]:
         """
@@ -974,6 +1113,8 @@ class Game:
         Returns:
             Chosen region ID, or None if cancelled
         """
+        if not self._has_human:
+            return None
 
         # Set up UI state for region selection
         self.waiting_for_region_selection = True
@@ -990,8 +1131,7 @@ class Game:
 
         # Wait for click in game loop
         while self.waiting_for_region_selection:
-            # Handle events
-            self.handle_events()
+            self._wait_frame()
 
             # Check if user pressed ESC to cancel
             keys = pygame.key.get_pressed()
@@ -1000,13 +1140,6 @@ class Game:
                 self.waiting_for_region_selection = False
                 return None
 
-            # Update and draw
-            self.update()
-            self.draw()
-
-            # Small delay
-            pygame.time.delay(10)
-
         # Clean up highlighting
         for region in available_regions:
             region.is_selectable = False
@@ -1016,11 +1149,11 @@ class Game:
 
     def occupy_region_for_player(self, player_id: int, region_id: int) -> bool:
         """Occupy a region for a player during occupation phase."""
-        if region_id not in self.state.regions:
+        region = self.state.regions.get(region_id)
+        if region is None:
             print(f"Error: Region {region_id} not found")
             return False
 
-        region = self.state.regions[region_id]
         player = self.state.players.get(player_id)
 
         if not player:
@@ -1032,7 +1165,7 @@ class Game:
             return False
 
         # Occupy the region
-        region.owner_id = player_id
+        self.state.set_region_owner(region_id, player_id)
         region.original_owner = player_id
         region.point_value = self.config.initial_region_points  # 500 points
         player.add_region(region_id)
@@ -1089,16 +1222,13 @@ class Game:
         pygame.draw.rect(self.screen, self.config.colors.panel, question_bg, border_radius=10)
         pygame.draw.rect(self.screen, self.config.colors.text_primary, question_bg, 2, border_radius=10)
 
-        # Draw question text
-        font = pygame.font.SysFont(self.config.font_name, self.config.font_sizes["body"])
-        question_lines = self.wrap_text(self.battle_question.text, font, 550)
+        # Draw question text (wrapped and rendered once per question)
+        if self._question_surface is None:
+            self._question_surface = self._render_question_text(self.battle_question.text)
 
-        y_pos = question_bg.y + 20
-        for line in question_lines:
-            text_surf = font.render(line, True, self.config.colors.text_primary)
-            text_rect = text_surf.get_rect(center=(question_bg.centerx, y_pos))
-            self.screen.blit(text_surf, text_rect)
-            y_pos += 30
+        text_rect = self._question_surface.get_rect(midtop=(question_bg.centerx, question_bg.y + 5))
+        self.screen.blit(self._question_surface, text_rect)
+        y_pos = question_bg.y + 20 + self._question_surface.get_height()
 
         # Draw answer box
         answer_box = pygame.Rect(
@@ -1110,7 +1240,7 @@ class Game:
         pygame.draw.rect(self.screen, self.config.colors.text_primary, answer_box, 2, border_radius=5)
 
         # Draw current answer
-        answer_font = pygame.font.SysFont(self.config.font_name, self.config.font_sizes["heading"])
+        answer_font = self._font_heading
         if self.human_answer_value is not None:
             answer_text = str(int(self.human_answer_value))  # Force integer display
         else:
@@ -1120,22 +1250,34 @@ class Game:
         answer_rect = answer_surf.get_rect(center=(question_bg.centerx, y_pos + 50))
         self.screen.blit(answer_surf, answer_rect)
 
-        # Draw instructions
-        inst_font = pygame.font.SysFont(self.config.font_name, self.config.font_sizes["small"])
-        instructions = [
-            "Enter numbers with keyboard or numpad",
-            "BACKSPACE: delete last digit",
-            "ENTER: submit answer",
-            "-: toggle negative sign",
-            "ESC: cancel"
+        # Draw instructions (pre-rendered in setup_display)
+        self.screen.blit(
+            self._instructions_surface,
+            (question_bg.x + 20, question_bg.bottom - 80 - self._instructions_offset)
+        )
+
+    def _render_question_text(self, text: str) -> pygame.Surface:
+        """
+        Render wrapped question text onto a single transparent surface.
+
+        Args:
+            text: Question text
+
+        Returns:
+            Surface with one centered line every 30 pixels
+        """
+        font = self._font_body
+        line_surfaces = [
+            font.render(line, True, self.config.colors.text_primary)
+            for line in self.wrap_text(text, font, 550)
         ]
 
-        y_pos = question_bg.bottom - 80
-        for inst in instructions:
-            inst_surf = inst_font.render(inst, True, self.config.colors.text_secondary)
-            inst_rect = inst_surf.get_rect(midleft=(question_bg.x + 20, y_pos))
-            self.screen.blit(inst_surf, inst_rect)
-            y_pos += 25
+        width = max([550] + [line_surf.get_width() for line_surf in line_surfaces])
+        surface = pygame.Surface((width, 30 * len(line_surfaces)), pygame.SRCALPHA)
+        for i, line_surf in enumerate(line_surfaces):
+            surface.blit(line_surf, line_surf.get_rect(center=(width // 2, 15 + 30 * i)))
+
+        return surface
 
     def update(self) -> None:
         """Update game state."""
@@ -1152,28 +1294,44 @@ class Game:
 
     def wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
         """Wrap text to fit within max_width."""
-        words = text.split(' ')
-        lines = []
-        current_line = []
+        return wrap_text(text, font, max_width)
+
+    def _wait_frame(self) -> None:
+        """
+        Run one step of a blocking wait loop (questions and region selection).
+
+        Blocks until input arrives or WAIT_LOOP_EVENT_TIMEOUT_MS passes. The
+        screen is only updated and redrawn after input, or every
+        WAIT_LOOP_REDRAW_INTERVAL seconds to keep the countdown moving.
+        """
+        event = pygame.event.wait(self.WAIT_LOOP_EVENT_TIMEOUT_MS)
+        if event.type != pygame.NOEVENT:
+            self.handle_events([event] + pygame.event.get())
+
+        now = time.time()
+        if self._dirty or now - self._last_wait_redraw >= self.WAIT_LOOP_REDRAW_INTERVAL:
+            self.update()
+            self.draw()
+            self._dirty = False
+            self._last_wait_redraw = now
 
-        for word in words:
-            current_line.append(word)
-            test_line = ' '.join(current_line)
-            test_width = font.size(test_line)[0]
+            # Cap the redraw rate while events stream in (e.g. mouse motion)
+            self.clock.tick(self.WAIT_LOOP_FPS)
 
-            if test_width > max_width:
-                current_line.pop()
-                lines.append(' '.join(current_line))
-                current_line = [word]
+    def handle_events(self, events: Optional[List[pygame.event.Event]] = None) -> None:
+        """
+        Handle Pygame events.
 
-        if current_line:
-            lines.append(' '.join(current_line))
+        Args:
+            events: Events already taken from the queue (None = fetch pending events)
+        """
+        if events is None:
+            events = pygame.event.get()
 
-        return lines
+        for event in events:
+            # Any input may change what is on screen
+            self._dirty = True
 
-    def handle_events(self) -> None:
-        """Handle Pygame events."""
-        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -1193,23 +1351,19 @@ class Game:
                 # Handle number input for open answer questions (keyboard fallback for occupation phase)
                 elif self.waiting_for_human_answer and self.current_question_screen in ["occupation", "battle"]:
                     if pygame.K_0 <= event.key <= pygame.K_9:
-                        # Append digit to answer
+                        # Append digit to answer (away from zero for negative answers)
                         digit = event.key - pygame.K_0
                         if self.human_answer_value is None:
                             self.human_answer_value = digit
                         else:
-                            current = str(int(self.human_answer_value))
-                            new_value = current + str(digit)
-                            self.human_answer_value = int(new_value)
+                            value = int(self.human_answer_value)
+                            self.human_answer_value = value * 10 - digit if value < 0 else value * 10 + digit
 
                     elif event.key == pygame.K_BACKSPACE:
-                        # Remove last digit
+                        # Remove last digit (truncating toward zero keeps the sign)
                         if self.human_answer_value is not None:
-                            str_val = str(self.human_answer_value)
-                            if len(str_val) > 1:
-                                self.human_answer_value = int(str_val[:-1])
-                            else:
-                                self.human_answer_value = 0
+                            value = int(self.human_answer_value)
+                            self.human_answer_value = value // 10 if value >= 0 else -(-value // 10)
 
                     elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
                         # Submit answer
@@ -1254,7 +1408,8 @@ class Game:
             return
 
         # Check if in turn phase and human's turn
-        if (self.state.current_phase == GamePhase.TURN and
+        if (self._has_human and
+            self.state.current_phase == GamePhase.TURN and
             self.state.current_player_id == 0):
             region_id = self.get_region_at_position(pos)
             if region_id is not None:
@@ -1262,13 +1417,20 @@ class Game:
 
     def get_region_at_position(self, pos: Tuple[int, int]) -> Optional[int]:
         """Get region ID at mouse position, or None if no region."""
-        # Simple implementation - check distance to region centers
-        for region in self.state.regions.values():
-            region_pos = region.position
-            # Assuming position is (x, y) tuple
-            distance = ((pos[0] - region_pos[0]) ** 2 + (pos[1] - region_pos[1]) ** 2) ** 0.5
-            if distance < 30:  # Click radius - adjust based on your region size
-                return region.region_id
+        cell_size = self.REGION_CLICK_RADIUS
+        radius_sq = cell_size * cell_size
+        x, y = pos
+        cell_x, cell_y = int(x // cell_size), int(y // cell_size)
+        regions = self.state.regions
+        region_grid = self._region_grid
+
+        # Any region within the click radius is centered in one of the 9 surrounding cells
+        for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+            for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+                for region_id in region_grid.get((grid_x, grid_y), ()):
+                    region_x, region_y = regions[region_id].position
+                    if (x - region_x) ** 2 + (y - region_y) ** 2 < radius_sq:
+                        return region_id
         return None
 
     def turn_phase(self) -> None:
@@ -1286,18 +1448,19 @@ class Game:
            - Recalculate remaining turns
         3. End turn phase when complete
         """
-        print("\n=== STARTING TURN PHASE ===")
+        logger.info("\n=== STARTING TURN PHASE ===")
 
         # 1. Get turn order
         self.turn_order = self.state.get_player_turn_order()
-        print(f"Turn order: {[self.state.players[pid].name for pid in self.turn_order]}")
+        logger.info("Turn order: %s", [self.state.players[pid].name for pid in self.turn_order])
 
         # 2. Calculate total turns available
         alive_players = len([p for p in self.state.players.values() if p.is_alive])
         total_turns = alive_players * self.state.max_turns_per_player
         current_turn = 0  # Current turn counter
 
-        print(f"Total turns available: {total_turns} ({alive_players} players × {self.state.max_turns_per_player} turns)")
+        logger.info("Total turns available: %d (%d players × %d turns)",
+                    total_turns, alive_players, self.state.max_turns_per_player)
 
         # Main turn loop
         while current_turn < total_turns:
@@ -1316,23 +1479,23 @@ class Game:
             player = self.state.players[current_player_id]
 
             special_text = " (SPECIAL ROUND - POINTS DOUBLED!)" if self.state.is_special_round else ""
-            print(f"\n--- Turn {self.state.current_turn}{special_text} ---")
-            print(f"Player {current_player_id} ({player.name})'s turn")
+            logger.debug("\n--- Turn %d%s ---", self.state.current_turn, special_text)
+            logger.debug("Player %d (%s)'s turn", current_player_id, player.name)
 
             # Skip dead players
             if not player.is_alive:
-                print(f"  Player {current_player_id} is dead, skipping turn")
+                logger.debug("  Player %d is dead, skipping turn", current_player_id)
                 current_turn += 1
                 continue
 
             # Get available actions for current player
             available_actions = self.logic.get_available_actions(current_player_id)
-            print(f"  Can attack regions: {available_actions['attack']}")
-            print(f"  Can fortify regions: {available_actions['fortify']}")
+            logger.debug("  Can attack regions: %s", available_actions['attack'])
+            logger.debug("  Can fortify regions: %s", available_actions['fortify'])
 
             # Check if player has any actions available
             if not available_actions['attack'] and not available_actions['fortify']:
-                print(f"  No available actions, skipping turn")
+                logger.debug("  No available actions, skipping turn")
                 current_turn += 1
                 continue
 
@@ -1351,11 +1514,11 @@ class Game:
                 # Check if game should end early
                 alive_count = len(self.state.get_alive_players())
                 if alive_count <= 1:
-                    print("\n  Only 0-1 players alive, ending turn phase early")
+                    logger.info("\n  Only 0-1 players alive, ending turn phase early")
                     break
 
         # End of turn phase
-        print("\n=== TURN PHASE COMPLETE ===")
+        logger.info("\n=== TURN PHASE COMPLETE ===")
         self.end_turn_phase()
 
     def _execute_human_turn(self, player_id: int, available_actions: Dict[str, List[int]]) -> bool:
@@ -1369,7 +1532,7 @@ class Game:
         Returns:
             True if turn was completed, False otherwise
         """
-        print(f"  Waiting for human player {player_id} to choose action...")
+        logger.debug("  Waiting for human player %d to choose action...", player_id)
 
         # Highlight available regions
         self._highlight_available_regions(player_id, available_actions)
@@ -1387,21 +1550,18 @@ class Game:
         # Wait for region selection in game loop
         selection_timeout = time.time() + 60  # 60 second timeout
         while self.waiting_for_region_selection and time.time() < selection_timeout:
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.time.delay(10)
+            self._wait_frame()
 
         # Check if selection was made
         if self.selected_region_id is None or self.selected_action is None:
-            print(f"  No selection made, auto-selecting action...")
+            logger.debug("  No selection made, auto-selecting action...")
             # Auto-select an action
             if available_actions['attack']:
                 self.selected_region_id = available_actions['attack'][0]
-                self.selected_action = "attack"
+                self.selected_action = TurnAction.ATTACK
             elif available_actions['fortify']:
                 self.selected_region_id = available_actions['fortify'][0]
-                self.selected_action = "fortify"
+                self.selected_action = TurnAction.FORTIFY
             else:
                 return False
 
@@ -1423,21 +1583,22 @@ class Game:
             player_id: ID of player
             available_actions: Dictionary with 'attack' and 'fortify' region lists
         """
+        regions = self.state.regions
+
         # Unhighlight all first
-        for region in self.state.regions.values():
+        for region in regions.values():
             region.is_selectable = False
 
         # Highlight attack targets
         for region_id in available_actions['attack']:
-            region = self.state.regions[region_id]
-            region.is_selectable = True
+            regions[region_id].is_selectable = True
 
         # Highlight fortify targets
         for region_id in available_actions['fortify']:
-            region = self.state.regions[region_id]
-            region.is_selectable = True
+            regions[region_id].is_selectable = True
 
-        print(f"  Highlighted {len(available_actions['attack'])} attack and {len(available_actions['fortify'])} fortify targets")
+        logger.debug("  Highlighted %d attack and %d fortify targets",
+                     len(available_actions['attack']), len(available_actions['fortify']))
 
     def _unhighlight_all_regions(self) -> None:
         """Remove highlighting from all regions."""
@@ -1455,12 +1616,12 @@ class Game:
         Returns:
             True if action was executed
         """
-        ai = self.ai_players.get(player_id)
+        ai = self._get_ai_controller(player_id)
         if not ai:
-            print(f"  No AI controller for player {player_id}")
+            logger.warning("  No AI controller for player %d", player_id)
             return True
 
-        print(f"  AI {player_id} thinking...")
+        logger.debug("  AI %d thinking...", player_id)
 
         action_type = None
         target_region_id = None
@@ -1474,9 +1635,9 @@ class Game:
             # Use StrategicAI to choose best attack target
             chosen_target = ai.choose_attack_target(attack_targets)
             if chosen_target:
-                action_type = "attack"
+                action_type = TurnAction.ATTACK
                 target_region_id = chosen_target.region_id
-                print(f"  AI {player_id} chooses to attack region {target_region_id}")
+                logger.debug("  AI %d chooses to attack region %d", player_id, target_region_id)
 
         # If no attack, try fortify
         if action_type is None and available_actions['fortify']:
@@ -1486,65 +1647,68 @@ class Game:
             # Use StrategicAI to choose best region to fortify
             chosen_target = ai.choose_region_to_fortify(fortify_targets)
             if chosen_target:
-                action_type = "fortify"
+                action_type = TurnAction.FORTIFY
                 target_region_id = chosen_target.region_id
-                print(f"  AI {player_id} chooses to fortify region {target_region_id}")
+                logger.debug("  AI %d chooses to fortify region %d", player_id, target_region_id)
 
         # If still no action, skip
         if action_type is None or target_region_id is None:
-            print(f"  AI {player_id} has no good actions, skipping turn")
+            logger.debug("  AI %d has no good actions, skipping turn", player_id)
             return True
 
         # Execute the action
         self._execute_turn_action(player_id, target_region_id, action_type)
         return True
 
-    def _execute_turn_action(self, player_id: int, region_id: int, action_type: str) -> bool:
+    def _execute_turn_action(self, player_id: int, region_id: int, action_type: TurnAction) -> bool:
         """
         Execute a turn action (attack or fortify).
 
         Args:
             player_id: ID of player executing action
             region_id: ID of target region
-            action_type: "attack" or "fortify"
+            action_type: TurnAction.ATTACK or TurnAction.FORTIFY
 
         Returns:
             True if action was successful
         """
-        print(f"  Executing {action_type} action on region {region_id}...")
+        handler = self._action_handlers.get(action_type)
+        if handler is None:
+            return False
 
-        if action_type == "attack":
-            # Validate attack
-            if not self.logic.can_attack_region(player_id, region_id):
-                print(f"  Invalid attack attempt")
-                return False
+        logger.debug("  Executing %s action on region %d...", action_type.name.lower(), region_id)
+        return handler(player_id, region_id)
 
-            # Trigger battle
-            self._start_turn_battle(player_id, region_id)
-            return True
+    def _execute_attack_action(self, player_id: int, region_id: int) -> bool:
+        """Validate an attack and run the resulting battle."""
+        if not self.logic.can_attack_region(player_id, region_id):
+            logger.warning("  Invalid attack attempt")
+            return False
 
-        elif action_type == "fortify":
-            # Validate fortify
-            if not self.logic.can_fortify_region(player_id, region_id):
-                print(f"  Invalid fortify attempt")
-                return False
+        # Trigger battle
+        self._start_turn_battle(player_id, region_id)
+        return True
 
-            # Execute fortification
-            success = self.logic.fortify_region(player_id, region_id)
+    def _execute_fortify_action(self, player_id: int, region_id: int) -> bool:
+        """Validate and apply a fortification."""
+        if not self.logic.can_fortify_region(player_id, region_id):
+            logger.warning("  Invalid fortify attempt")
+            return False
 
-            if success:
-                print(f"  Player {player_id} fortified region {region_id}")
-                # Play sound if available
-                if self.sound_manager:
-                    self.sound_manager.play_sound("fortify")
+        # Execute fortification
+        success = self.logic.fortify_region(player_id, region_id)
 
-                # Draw changes
-                self.draw()
-                pygame.time.delay(500)
+        if success:
+            logger.debug("  Player %d fortified region %d", player_id, region_id)
+            # Play sound if available
+            if self.sound_manager:
+                self.sound_manager.play_sound("fortify")
 
-            return success
+            # Draw changes
+            self.draw()
+            pygame.time.delay(500)
 
-        return False
+        return success
 
     def _start_turn_battle(self, attacker_id: int, region_id: int) -> None:
         """
@@ -1560,22 +1724,26 @@ class Game:
         defender_id = region.owner_id
 
         if defender_id is None:
-            print(f"  Error: Region {region_id} has no owner")
+            logger.error("  Error: Region %d has no owner", region_id)
             return
 
-        print(f"  Battle: Player {attacker_id} attacking {region.name} (owned by {defender_id})")
+        logger.debug("  Battle: Player %d attacking %s (owned by %d)", attacker_id, region.name, defender_id)
 
         # For capital attacks, loop until capital is destroyed or defender wins
         is_capital = region.region_type == RegionType.CAPITAL
 
+        # A single battle record is reused for every round of a capital siege
+        battle = BattleResult(
+            attacker_id=attacker_id,
+            defender_id=defender_id,
+            region_id=region_id
+        )
+        self.state.current_battle = battle
+
         while True:
             # Set up battle state
             self.state.current_phase = GamePhase.CAPITAL_ATTACK if is_capital else GamePhase.BATTLE
-            self.state.current_battle = BattleResult(
-                attacker_id=attacker_id,
-                defender_id=defender_id,
-                region_id=region_id
-            )
+            battle.reset()
 
             # Start battle question flow (blocking)
             self.start_battle_question_flow()
@@ -1585,20 +1753,20 @@ class Game:
                 # Check if the capital region still exists
                 if region_id not in self.state.capitals:
                     # Capital was destroyed, turn ends
-                    print(f"  Capital destroyed. Turn ends.")
+                    logger.debug("  Capital destroyed. Turn ends.")
                     break
                 # Check if defender is still alive
                 if not self.state.players[defender_id].is_alive:
                     # Defender eliminated, turn ends
-                    print(f"  Defender eliminated. Turn ends.")
+                    logger.debug("  Defender eliminated. Turn ends.")
                     break
                 # Check the result of the last battle
-                if self.state.current_battle.winner_id != attacker_id:
+                if battle.winner_id != attacker_id:
                     # Attacker lost the last battle, turn ends
-                    print(f"  Attack repelled. Turn ends.")
+                    logger.debug("  Attack repelled. Turn ends.")
                     break
                 # Attacker won but capital still has HP - ask another question
-                print(f"  Capital damaged but not destroyed. Asking for another attack...")
+                logger.debug("  Capital damaged but not destroyed. Asking for another attack...")
                 continue
             else:
                 # Normal region attack - turn ends
@@ -1615,13 +1783,13 @@ class Game:
 
         # Determine action type based on region ownership
         if region.owner_id == self.current_selection_player:
-            self.selected_action = "fortify"
+            self.selected_action = TurnAction.FORTIFY
         else:
-            self.selected_action = "attack"
+            self.selected_action = TurnAction.ATTACK
 
         self.selected_region_id = region_id
         self.waiting_for_region_selection = False
-        print(f"  Human selected region {region_id} for {self.selected_action}")
+        logger.debug("  Human selected region %d for %s", region_id, self.selected_action.name.lower())
 
     def start_battle_question_flow(self) -> Optional[BattleResult]:
         """
@@ -1637,7 +1805,7 @@ class Game:
         attacker_id = self.state.current_battle.attacker_id
         defender_id = self.state.current_battle.defender_id
 
-        print(f"  Starting battle between {attacker_id} and {defender_id}")
+        logger.debug("  Starting battle between %d and %d", attacker_id, defender_id)
 
         # Get a multiple choice question from loaded questions
         categories = self.config.get_included_categories()
@@ -1656,7 +1824,7 @@ class Game:
 
         # Store question for display
         self.battle_question = question
-        print(f"  Battle question: {question.text}")
+        logger.debug("  Battle question: %s", question.text)
 
         # Get answers from both players
         attacker_answer = None
@@ -1669,7 +1837,7 @@ class Game:
         if attacker.player_type == PlayerType.HUMAN:
             attacker_answer = self._get_human_battle_answer(question)
         else:
-            ai = self.ai_players.get(attacker_id)
+            ai = self._get_ai_controller(attacker_id)
             if ai:
                 think_time = self.config.get_ai_think_time() / 1000.0
                 attacker_answer = ai.answer_multiple_choice(question, think_time)
@@ -1678,7 +1846,7 @@ class Game:
         if defender.player_type == PlayerType.HUMAN:
             defender_answer = self._get_human_battle_answer(question)
         else:
-            ai = self.ai_players.get(defender_id)
+            ai = self._get_ai_controller(defender_id)
             if ai:
                 think_time = self.config.get_ai_think_time() / 1000.0
                 defender_answer = ai.answer_multiple_choice(question, think_time)
@@ -1697,7 +1865,7 @@ class Game:
 
             # Check if tie in MC (both answered correctly)
             if result.winner_id is None:
-                print("  Tie in multiple choice! Going to open answer tie-breaker...")
+                logger.debug("  Tie in multiple choice! Going to open answer tie-breaker...")
                 result = self._resolve_battle_tie_with_open_answer(
                     attacker_id=attacker_id,
                     defender_id=defender_id,
@@ -1724,7 +1892,7 @@ class Game:
         Returns:
             Player's answer, or None if timeout
         """
-        print("  Waiting for human player battle answer...")
+        logger.debug("  Waiting for human player battle answer...")
 
         # Show question through screen manager
         if self.screen_manager and question:
@@ -1742,14 +1910,11 @@ class Game:
         while self.waiting_for_human_answer:
             elapsed = time.time() - start_time
             if elapsed > 30:  # 30 second timeout
-                print("  Time's up for battle question!")
+                logger.debug("  Time's up for battle question!")
                 self.waiting_for_human_answer = False
                 break
 
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.time.delay(10)
+            self._wait_frame()
 
         answer = self.human_answer_value
         self.human_answer_value = None  # Reset for next question
@@ -1783,7 +1948,7 @@ class Game:
                 options=[]
             )
 
-        print(f"  Tie-breaker question: {question.text}")
+        logger.debug("  Tie-breaker question: %s", question.text)
 
         # Get answers from both players (only these two)
         answers = {}
@@ -1796,7 +1961,7 @@ class Game:
         if attacker.player_type == PlayerType.HUMAN:
             answer = self._get_human_battle_open_answer(question)
         else:
-            ai = self.ai_players.get(attacker_id)
+            ai = self._get_ai_controller(attacker_id)
             if ai:
                 think_time = self.config.get_ai_think_time() / 1000.0
                 answer = ai.answer_open_question(question, think_time)
@@ -1811,7 +1976,7 @@ class Game:
         if defender.player_type == PlayerType.HUMAN:
             answer = self._get_human_battle_open_answer(question)
         else:
-            ai = self.ai_players.get(defender_id)
+            ai = self._get_ai_controller(defender_id)
             if ai:
                 think_time = self.config.get_ai_think_time() / 1000.0
                 answer = ai.answer_open_question(question, think_time)
@@ -1844,7 +2009,7 @@ class Game:
         Returns:
             Player's numeric answer, or None if timeout
         """
-        print("  Waiting for human player open answer (tie-breaker)...")
+        logger.debug("  Waiting for human player open answer (tie-breaker)...")
 
         # Show open answer question
         if self.screen_manager and question:
@@ -1862,14 +2027,11 @@ class Game:
         while self.waiting_for_human_answer:
             elapsed = time.time() - start_time
             if elapsed > 30:  # 30 second timeout
-                print("  Time's up for open answer tie-breaker!")
+                logger.debug("  Time's up for open answer tie-breaker!")
                 self.waiting_for_human_answer = False
                 return None
 
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.time.delay(10)
+            self._wait_frame()
 
         return self.human_answer_value
 
@@ -1881,21 +2043,21 @@ class Game:
             result: BattleResult with winner and outcome
         """
         if result.winner_id is None:
-            print("  Battle result: TIE - no winner determined")
+            logger.debug("  Battle result: TIE - no winner determined")
             return
 
         winner = self.state.players.get(result.winner_id)
         if winner is None:
-            print("  Error: Winner not found")
+            logger.error("  Error: Winner not found")
             return
 
         region = self.state.regions.get(result.region_id)
 
         if region is None:
-            print("  Error: Region not found")
+            logger.error("  Error: Region not found")
             return
 
-        print(f"  Battle result: {winner.name} wins!")
+        logger.debug("  Battle result: %s wins!", winner.name)
 
         # Check if this is a capital attack
         if self.state.current_phase == GamePhase.CAPITAL_ATTACK:
@@ -1903,13 +2065,16 @@ class Game:
             self.logic.execute_capital_attack(result.attacker_id, result.region_id, result)
             return
 
+        # Points are doubled in special rounds
+        multiplier = 2 if self.state.is_special_round else 1
+
         # If attacker wins, capture the region
         if result.winner_id == result.attacker_id and result.region_captured:
-            print(f"  Capturing region {region.name}...")
+            logger.debug("  Capturing region %s...", region.name)
             old_owner_id = region.owner_id
 
             # Update region ownership
-            region.owner_id = result.attacker_id
+            self.state.set_region_owner(result.region_id, result.attacker_id)
             region.fortification = FortificationLevel.NONE  # Reset fortification
 
             # Update player regions
@@ -1922,42 +2087,41 @@ class Game:
             attacker.add_region(result.region_id)
 
             # Award points (doubled if special round)
-            points = self.logic.calculate_region_value(region)
-            earned_points = points * 2 if self.state.is_special_round else points
+            earned_points = self.logic.calculate_region_value(region) * multiplier
             attacker.score += earned_points
 
             if self.state.is_special_round:
-                print(f"  {attacker.name} gained {earned_points} points (SPECIAL ROUND - doubled!)")
+                logger.debug("  %s gained %d points (SPECIAL ROUND - doubled!)", attacker.name, earned_points)
             else:
-                print(f"  {attacker.name} gained {earned_points} points")
+                logger.debug("  %s gained %d points", attacker.name, earned_points)
 
         # Award defender bonus if they won
         if result.defender_bonus_awarded and result.winner_id == result.defender_id:
             defender = self.state.players[result.defender_id]
-            bonus_points = 50  # Fixed defender bonus
-            earned_bonus = bonus_points * 2 if self.state.is_special_round else bonus_points
+            earned_bonus = 50 * multiplier  # Fixed defender bonus
             defender.score += earned_bonus
             if self.state.is_special_round:
-                print(f"  {defender.name} earned {earned_bonus} defender bonus points (SPECIAL ROUND - doubled!)")
+                logger.debug("  %s earned %d defender bonus points (SPECIAL ROUND - doubled!)",
+                             defender.name, earned_bonus)
             else:
-                print(f"  {defender.name} earned {earned_bonus} defender bonus points")
+                logger.debug("  %s earned %d defender bonus points", defender.name, earned_bonus)
 
     def end_turn_phase(self) -> None:
         """
         End the turn phase and determine game outcome.
         """
-        print("\n=== END TURN PHASE ===")
+        logger.info("\n=== END TURN PHASE ===")
 
         # Check for winner
         winner = self.logic.check_game_over()
 
         if winner is not None:
-            print(f"\n*** GAME OVER ***")
-            print(f"Player {winner} ({self.state.players[winner].name}) wins!")
+            logger.info("\n*** GAME OVER ***")
+            logger.info("Player %d (%s) wins!", winner, self.state.players[winner].name)
             self.state.current_phase = GamePhase.GAME_OVER
         else:
             # More rounds could happen, but for now move to game over
-            print("Turn phase complete. Game ending...")
+            logger.info("Turn phase complete. Game ending...")
             self.state.current_phase = GamePhase.GAME_OVER
 
     def run(self) -> None:
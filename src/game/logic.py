@@ -1,14 +1,18 @@
 from __future__ import annotations
+import logging
 import math
+from operator import attrgetter
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
 
 from src.utils.config import GameConfig
 from src.game.state import (
-    GameState, GamePhase, Player, Region, RegionType, BattleResult
+    GameState, GamePhase, Player, Region, RegionType, FortificationLevel, BattleResult
 )
 from src.trivia.question import Question, QuestionType
 
+logger = logging.getLogger(__name__)
+
 
 class BattleOutcome(Enum):
     """Possible outcomes of a battle."""
@@ -34,6 +38,15 @@ class GameLogic:
         self.state = game_state
         self.config = config
 
+        # Region values indexed by Region.has_been_captured (False -> initial, True -> captured)
+        self._region_values = (config.initial_region_points, config.captured_region_points)
+
+        # Last available actions per player, tagged with the state version they were built at
+        self._actions_cache: Dict[int, Tuple[int, Dict[str, List[int]]]] = {}
+
+        # Adjacency errors from the last symmetry check, keyed by (adjacency version, region count)
+        self._adjacency_check: Optional[Tuple[Tuple[int, int], List[str]]] = None
+
     def calculate_distance(self, pos1: Tuple[float, float],
                           pos2: Tuple[float, float]) -> float:
         """
@@ -46,7 +59,7 @@ class GameLogic:
         Returns:
             Distance
         """
-        return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+        return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
 
     def can_attack_region(self, attacker_id: int, region_id: int) -> bool:
         """
@@ -69,12 +82,7 @@ class GameLogic:
             return False
 
         # Check: Attacker must have at least one adjacent region
-        attacker_regions = self.state.get_player_regions(attacker_id)
-        for attacker_region in attacker_regions:
-            if region.is_adjacent_to(attacker_region.region_id):
-                return True
-
-        return False
+        return region_id in self.state.get_border_targets(attacker_id)
 
     def can_fortify_region(self, player_id: int, region_id: int) -> bool:
         """
@@ -87,27 +95,36 @@ class GameLogic:
         Returns:
             True if fortification is valid
         """
-        if region_id not in self.state.regions:
+        region = self.state.regions.get(region_id)
+        if region is None:
             return False
+        return self._is_fortifiable(player_id, region)
 
-        region = self.state.regions[region_id]
+    def _is_fortifiable(self, player_id: int, region: Region) -> bool:
+        """
+        Check the fortification rules for a region object already looked up.
 
+        Args:
+            player_id: ID of player
+            region: Region to fortify
+
+        Returns:
+            True if fortification is valid
+        """
         # Check: Region must be owned by player
         if region.owner_id != player_id:
             return False
 
         # Check: Region must not already be fortified
-        if region.is_fortified():
+        if region.fortification == FortificationLevel.FORTIFIED:
             return False
 
         # Check: Region must not be a capital (capitals have special rules)
         if region.region_type == RegionType.CAPITAL:
             # Capitals can only be fortified if they've been captured
-            if region_id in self.state.capitals:
-                capital = self.state.capitals[region_id]
-                if capital.owner_id == player_id:
-                    return True
-                return False
+            capital = self.state.capitals.get(region.region_id)
+            if capital is not None:
+                return capital.owner_id == player_id
 
         return True
 
@@ -172,7 +189,7 @@ class GameLogic:
             defender_id: ID of defending player
             region_id: ID of region being attacked
             question: The open answer question
-            answers: Dict of player_id -> answer
+            answers: Dict of player_id -> numeric answer (validated where it was entered)
             answer_times: Dict of player_id -> answer time
 
         Returns:
@@ -184,24 +201,23 @@ class GameLogic:
             region_id=region_id
         )
 
-        correct_answer = float(question.correct_answer)
+        correct_answer = question.numeric_answer
+        if correct_answer is None:
+            correct_answer = float(question.correct_answer)
 
         # Calculate closeness for both players
         player_closeness: List[Tuple[int, float, float]] = []  # (player_id, closeness, time)
 
-        for player_id in [attacker_id, defender_id]:
+        for player_id in (attacker_id, defender_id):
             if player_id in answers:
-                answer = answers[player_id]
-                try:
-                    closeness = abs(float(answer) - correct_answer)
-                except (ValueError, TypeError):
-                    closeness = float('inf')
-
-                time = answer_times.get(player_id, float('inf'))
+                closeness = abs(answers[player_id] - correct_answer)
+                time = answer_times.get(player_id, math.inf)
                 player_closeness.append((player_id, closeness, time))
 
-        # Sort by closeness (lower is better), then by time (lower is better)
-        player_closeness.sort(key=lambda x: (x[1], x[2]))
+        # Order by closeness (lower is better), then by time (lower is better).
+        # At most two entries, so a single comparison replaces the sort.
+        if len(player_closeness) == 2 and player_closeness[1][1:] < player_closeness[0][1:]:
+            player_closeness.reverse()
 
         # Extract ranking
         ranking = [player_id for player_id, _, _ in player_closeness]
@@ -224,49 +240,57 @@ class GameLogic:
         Args:
             battle_result: Result of a battle
         """
-        if battle_result.winner_id is None:
+        winner_id = battle_result.winner_id
+        if winner_id is None:
             return
 
-        region = self.state.regions.get(battle_result.region_id)
+        state = self.state
+        players = state.players
+        region_id = battle_result.region_id
+        attacker_id = battle_result.attacker_id
+        defender_id = battle_result.defender_id
+
+        region = state.regions.get(region_id)
         if not region:
             return
 
-        attacker = self.state.players.get(battle_result.attacker_id)
-        defender = self.state.players.get(battle_result.defender_id)
+        attacker = players.get(attacker_id)
+        defender = players.get(defender_id)
 
         if not attacker or not defender:
             return
 
-        if battle_result.winner_id == battle_result.defender_id:
+        if winner_id == defender_id:
             # Defender wins
             if battle_result.defender_bonus_awarded:
-                defender.score += self.config.defense_bonus
-                print(f"Player {defender.name} defended successfully! +{self.config.defense_bonus} points")
+                defense_bonus = self.config.defense_bonus
+                defender.score += defense_bonus
+                logger.info("Player %s defended successfully! +%d points", defender.name, defense_bonus)
 
         else:  # Attacker wins
             # Capture the region
+            state.bump_version()
             old_owner_id = region.owner_id
+            old_owner = players.get(old_owner_id) if old_owner_id is not None else None
 
             # Remove from defender
-            if old_owner_id is not None:
-                old_owner = self.state.players.get(old_owner_id)
-                if old_owner:
-                    old_owner.remove_region(region.region_id)
+            if old_owner:
+                old_owner.remove_region(region_id)
 
             # Add to attacker
-            region.change_owner(battle_result.attacker_id, via_capital_capture=False)
+            region.change_owner(attacker_id, via_capital_capture=False)
             region.remove_fortification()  # Fortification is destroyed on capture
-            attacker.add_region(region.region_id)
+            attacker.add_region(region_id)
 
             # Update scores
-            attacker.score += region.point_value
-            if old_owner_id is not None:
-                old_owner = self.state.players[old_owner_id]
-                old_owner.score -= region.point_value
+            point_value = region.point_value
+            attacker.score += point_value
+            if old_owner:
+                old_owner.score -= point_value
 
             battle_result.region_captured = True
 
-            print(f"Player {attacker.name} captured {region.name}! +{region.point_value} points")
+            logger.info("Player %s captured %s! +%d points", attacker.name, region.name, point_value)
 
     def execute_capital_attack(self, attacker_id: int, capital_region_id: int,
                               battle_result: BattleResult) -> bool:
@@ -281,31 +305,38 @@ class GameLogic:
         Returns:
             True if capital was destroyed, False otherwise
         """
-        if capital_region_id not in self.state.capitals:
+        state = self.state
+        capitals = state.capitals
+
+        capital = capitals.get(capital_region_id)
+        if capital is None:
             return False
 
-        capital = self.state.capitals[capital_region_id]
-        region = self.state.regions.get(capital_region_id)
+        region = state.regions.get(capital_region_id)
 
         if not region:
             return False
 
-        attacker = self.state.players.get(attacker_id)
-        defender = self.state.players.get(capital.owner_id)
+        players = state.players
+        defender_id = capital.owner_id
+        attacker = players.get(attacker_id)
+        defender = players.get(defender_id)
 
         if not attacker or not defender:
             return False
 
-        if battle_result.winner_id == attacker_id:
+        winner_id = battle_result.winner_id
+        if winner_id == attacker_id:
             # Attacker hits the capital
+            state.bump_version()
             capital_destroyed = capital.take_damage()
 
             if capital_destroyed:
                 # Capital captured!
-                print(f"Player {attacker.name} captured {defender.name}'s capital!")
+                logger.info("Player %s captured %s's capital!", attacker.name, defender.name)
 
                 # Eliminate defender and transfer territories
-                self.state.eliminate_player(capital.owner_id, attacker_id)
+                state.eliminate_player(defender_id, attacker_id)
 
                 # The capital region becomes a normal region
                 region.region_type = RegionType.NORMAL
@@ -313,19 +344,22 @@ class GameLogic:
                 region.has_been_captured = True
 
                 # Remove capital object (it's now a normal region)
-                del self.state.capitals[capital_region_id]
+                del capitals[capital_region_id]
+                state.damaged_capitals.discard(capital_region_id)
 
                 return True
             else:
-                print(f"Player {attacker.name} damaged {defender.name}'s capital! "
-                      f"HP: {capital.current_hp}/{capital.max_hp}")
+                state.damaged_capitals.add(capital_region_id)
+                logger.info("Player %s damaged %s's capital! HP: %d/%d",
+                            attacker.name, defender.name, capital.current_hp, capital.max_hp)
                 return False
 
-        elif battle_result.winner_id == capital.owner_id and battle_result.defender_bonus_awarded:
+        elif winner_id == defender_id and battle_result.defender_bonus_awarded:
             # Successful defense
-            defender.score += self.config.defense_bonus
+            defense_bonus = self.config.defense_bonus
+            defender.score += defense_bonus
             capital.register_attack()  # Reset regeneration
-            print(f"Player {defender.name} defended their capital! +{self.config.defense_bonus} points")
+            logger.info("Player %s defended their capital! +%d points", defender.name, defense_bonus)
 
         return False
 
@@ -344,6 +378,7 @@ class GameLogic:
             return False
 
         region = self.state.regions[region_id]
+        self.state.bump_version()
 
         # Special handling for captured capitals
         if region.region_type == RegionType.CAPITAL and region_id in self.state.capitals:
@@ -352,29 +387,43 @@ class GameLogic:
                 # Captured capital gets fortified (HP increases to 2)
                 capital.current_hp = 2
                 capital.max_hp = 2
-                print(f"Player {self.state.players[player_id].name} fortified captured capital {region.name}")
+                logger.info("Player %s fortified captured capital %s", self.state.players[player_id].name, region.name)
                 return True
 
         # Normal region fortification
         if region.fortify():
-            print(f"Player {self.state.players[player_id].name} fortified {region.name}")
+            logger.info("Player %s fortified %s", self.state.players[player_id].name, region.name)
             return True
 
         return False
 
     def update_capital_regeneration(self) -> None:
         """
-        Update capital HP regeneration for all capitals.
+        Update capital HP regeneration for damaged capitals.
         Called at the end of each turn.
         """
-        for capital in self.state.capitals.values():
+        regions = self.state.regions
+        capitals = self.state.capitals
+        damaged_capitals = self.state.damaged_capitals
+
+        # Capitals at full HP have nothing to regenerate (any damage resets their counter)
+        for region_id in list(damaged_capitals):
+            capital = capitals.get(region_id)
+            if capital is None or capital.is_destroyed:
+                damaged_capitals.discard(region_id)
+                continue
+
+            hp_before = capital.current_hp
             capital.increment_turn_counter()
             capital.regenerate()
 
-            if capital.current_hp > 0:
-                region = self.state.regions.get(capital.region_id)
+            if capital.current_hp > hp_before:
+                region = regions.get(region_id)
                 if region:
-                    print(f"Capital {region.name} regenerated to {capital.current_hp}/{capital.max_hp} HP")
+                    logger.info("Capital %s regenerated to %d/%d HP",
+                                region.name, capital.current_hp, capital.max_hp)
+            if capital.current_hp >= capital.max_hp:
+                damaged_capitals.discard(region_id)
 
     def check_game_over(self) -> Optional[int]:
         """
@@ -393,22 +442,16 @@ class GameLogic:
         if (self.state.current_phase == GamePhase.TURN and
             self.state.current_turn > self.state.max_turns_per_player * len(alive_players)):
 
-            # Player with highest score wins
-            highest_score = -1
-            winner_id = None
-
-            for player in alive_players:
-                if player.score > highest_score:
-                    highest_score = player.score
-                    winner_id = player.player_id
-
-            return winner_id
+            # Player with highest score wins (first in player order on ties)
+            if alive_players:
+                return max(alive_players, key=attrgetter('score')).player_id
 
         return None
 
     def get_available_actions(self, player_id: int) -> Dict[str, List[int]]:
         """
         Get available actions for a player during their turn.
+        Results are cached until the game state version changes.
 
         Args:
             player_id: ID of player
@@ -416,32 +459,33 @@ class GameLogic:
         Returns:
             Dictionary with 'attack' and 'fortify' lists of region IDs
         """
+        cached = self._actions_cache.get(player_id)
+        if cached is not None and cached[0] == self.state.version:
+            actions = cached[1]
+            return {'attack': actions['attack'].copy(), 'fortify': actions['fortify'].copy()}
+
         player = self.state.players.get(player_id)
         if not player or not player.is_alive:
             return {'attack': [], 'fortify': []}
 
-        attack_targets: List[int] = []
-        fortify_targets: List[int] = []
-
         # Get all enemy regions adjacent to player's regions
-        for player_region in self.state.get_player_regions(player_id):
-            for adj_id in player_region.adjacent_regions:
-                if adj_id in self.state.regions:
-                    adj_region = self.state.regions[adj_id]
-                    if (adj_region.owner_id is not None and
-                        adj_region.owner_id != player_id and
-                        adj_id not in attack_targets):
-
-                        attack_targets.append(adj_id)
+        attack_targets = sorted(self.state.get_border_targets(player_id))
+        fortify_targets: List[int] = []
 
         # Get all player regions that can be fortified
-        for player_region in self.state.get_player_regions(player_id):
-            if self.can_fortify_region(player_id, player_region.region_id):
-                fortify_targets.append(player_region.region_id)
+        regions = self.state.regions
+        for region_id in player.regions_controlled:
+            region = regions.get(region_id)
+            if region is not None and self._is_fortifiable(player_id, region):
+                fortify_targets.append(region_id)
 
-        return {
+        self._actions_cache[player_id] = (self.state.version, {
             'attack': attack_targets,
             'fortify': fortify_targets
+        })
+        return {
+            'attack': attack_targets.copy(),
+            'fortify': fortify_targets.copy()
         }
 
     def calculate_region_value(self, region: Region,
@@ -459,12 +503,8 @@ class GameLogic:
         if via_capital_capture:
             # Keep current value when captured via capital
             return region.point_value
-        elif region.has_been_captured:
-            # Already captured before → 800 points
-            return self.config.captured_region_points
-        else:
-            # First capture → 500 points, becomes 800 after
-            return self.config.initial_region_points
+        # First capture → 500 points, already captured before → 800 points
+        return self._region_values[region.has_been_captured]
 
     def validate_game_state(self) -> List[str]:
         """
@@ -474,39 +514,62 @@ class GameLogic:
             List of error messages, empty if valid
         """
         errors: List[str] = []
+        regions = self.state.regions
 
         # Check player-region consistency
         for player_id, player in self.state.players.items():
             for region_id in player.regions_controlled:
-                if region_id not in self.state.regions:
+                region = regions.get(region_id)
+                if region is None:
                     errors.append(f"Player {player_id} controls non-existent region {region_id}")
-                else:
-                    region = self.state.regions[region_id]
-                    if region.owner_id != player_id:
-                        errors.append(f"Region {region_id} owner mismatch: "
-                                     f"region.owner={region.owner_id}, player={player_id}")
+                elif region.owner_id != player_id:
+                    errors.append(f"Region {region_id} owner mismatch: "
+                                 f"region.owner={region.owner_id}, player={player_id}")
 
         # Check capital consistency
         for region_id, capital in self.state.capitals.items():
-            if region_id not in self.state.regions:
+            region = regions.get(region_id)
+            if region is None:
                 errors.append(f"Capital for non-existent region {region_id}")
             else:
-                region = self.state.regions[region_id]
                 if region.region_type != RegionType.CAPITAL:
                     errors.append(f"Region {region_id} has capital object but is not CAPITAL type")
                 if region.owner_id != capital.owner_id:
                     errors.append(f"Capital {region_id} owner mismatch: "
                                  f"region.owner={region.owner_id}, capital.owner={capital.owner_id}")
 
-        # Check adjacency symmetry
-        for region_id, region in self.state.regions.items():
-            for adj_id in region.adjacent_regions:
-                if adj_id not in self.state.regions:
-                    errors.append(f"Region {region_id} adjacent to non-existent region {adj_id}")
-                else:
-                    adj_region = self.state.regions[adj_id]
-                    if region_id not in adj_region.adjacent_regions:
-                        errors.append(f"Adjacency not symmetric: {region_id}->{adj_id} but not {adj_id}->{region_id}")
+        # Check adjacency symmetry (re-checked only after regions are added or rewired)
+        adjacency_key = (self.state.adjacency_version, len(regions))
+        if self._adjacency_check is None or self._adjacency_check[0] != adjacency_key:
+            self._adjacency_check = (adjacency_key, self._check_adjacency(regions))
+        errors.extend(self._adjacency_check[1])
+
+        return errors
+
+    def _check_adjacency(self, regions: Dict[int, Region]) -> List[str]:
+        """
+        Check that every adjacency points at an existing region and is symmetric.
+
+        Args:
+            regions: Regions to check
+
+        Returns:
+            List of error messages, empty if valid
+        """
+        errors: List[str] = []
+
+        # Collect every directed edge once, then look up reverses
+        edges = [
+            (region_id, adj_id)
+            for region_id, region in regions.items()
+            for adj_id in region.adjacent_regions
+        ]
+        edge_set = set(edges)
+        for region_id, adj_id in edges:
+            if adj_id not in regions:
+                errors.append(f"Region {region_id} adjacent to non-existent region {adj_id}")
+            elif (adj_id, region_id) not in edge_set:
+                errors.append(f"Adjacency not symmetric: {region_id}->{adj_id} but not {adj_id}->{region_id}")
 
         return errors
 
@@ -556,11 +619,13 @@ if __name__ == "__main__":
         position=(200, 100),
         owner_id=1
     )
-    region1.adjacent_regions = [2]
-    region2.adjacent_regions = [1]
+    region1.set_adjacent_regions([2])
+    region2.set_adjacent_regions([1])
 
     state.add_region(region1)
     state.add_region(region2)
+    player1.add_region(1)
+    player2.add_region(2)
 
     # Create game logic
     logic = GameLogic(state, config)
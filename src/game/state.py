@@ -1,30 +1,43 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any
-from enum import Enum, auto
+from typing import List, Deque, Dict, FrozenSet, Optional, Sequence, Set, Tuple, Any
+from enum import IntEnum, auto
 import json
+from collections import deque
+import time
 from datetime import datetime
+from operator import attrgetter, itemgetter
 
+import numpy as np
 
-class PlayerType(Enum):
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the standard json module is used without it
+    orjson = None
+
+# Battles kept in GameState.battle_history (older ones are dropped)
+BATTLE_HISTORY_LIMIT = 256
+
+
+class PlayerType(IntEnum):
     """Type of player."""
     HUMAN = auto()
     AI = auto()
 
 
-class RegionType(Enum):
+class RegionType(IntEnum):
     """Type of region."""
     NORMAL = auto()
     CAPITAL = auto()
 
 
-class FortificationLevel(Enum):
+class FortificationLevel(IntEnum):
     """Fortification levels for regions."""
     NONE = auto()
     FORTIFIED = auto()
 
 
-class GamePhase(Enum):
+class GamePhase(IntEnum):
     """Current phase of the game."""
     SETUP = auto()        # Game setup, choosing settings
     SPAWNING = auto()     # Placing capitals
@@ -35,7 +48,24 @@ class GamePhase(Enum):
     GAME_OVER = auto()    # Game ended
 
 
-@dataclass
+# Saves store enum members by name; plain dicts make the reverse lookup cheap
+_PLAYER_TYPES: Dict[str, PlayerType] = {member.name: member for member in PlayerType}
+_REGION_TYPES: Dict[str, RegionType] = {member.name: member for member in RegionType}
+_FORTIFICATION_LEVELS: Dict[str, FortificationLevel] = {member.name: member for member in FortificationLevel}
+_GAME_PHASES: Dict[str, GamePhase] = {member.name: member for member in GamePhase}
+
+# Saved fields in constructor order, fetched from a dict in one call
+_player_fields = itemgetter(
+    'player_id', 'name', 'player_type', 'color', 'score', 'is_alive',
+    'regions_controlled', 'capital_region_id', 'turns_played'
+)
+_region_fields = itemgetter(
+    'region_id', 'name', 'position', 'owner_id', 'region_type', 'fortification',
+    'adjacent_regions', 'point_value', 'has_been_captured', 'original_owner', 'is_selectable'
+)
+
+
+@dataclass(slots=True)
 class Player:
     """
     Represents a player in the game.
@@ -45,17 +75,16 @@ class Player:
     player_id: int  # 0 for human, 1+ for AI
     name: str
     player_type: PlayerType
-    color: Tuple[int, int, int]
+    color: Sequence[int]  # (r, g, b); a list when loaded from a save
     score: int = 1000  # Starting score
     is_alive: bool = True
-    regions_controlled: List[int] = field(default_factory=list[int])  # Region IDs
+    regions_controlled: Set[int] = field(default_factory=set[int])  # Region IDs
     capital_region_id: Optional[int] = None
     turns_played: int = 0
 
     def add_region(self, region_id: int) -> None:
         """Add a region to player's control."""
-        if region_id not in self.regions_controlled:
-            self.regions_controlled.append(region_id)
+        self.regions_controlled.add(region_id)
 
     def remove_region(self, region_id: int) -> bool:
         """
@@ -78,7 +107,7 @@ class Player:
             'color': list(self.color),
             'score': self.score,
             'is_alive': self.is_alive,
-            'regions_controlled': self.regions_controlled.copy(),
+            'regions_controlled': sorted(self.regions_controlled),
             'capital_region_id': self.capital_region_id,
             'turns_played': self.turns_played
         }
@@ -86,20 +115,15 @@ class Player:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Player:
         """Create player from dictionary."""
+        (player_id, name, player_type, color, score, is_alive,
+         regions_controlled, capital_region_id, turns_played) = _player_fields(data)
         return cls(
-            player_id=data['player_id'],
-            name=data['name'],
-            player_type=PlayerType[data['player_type']],
-            color=tuple(data['color']),
-            score=data['score'],
-            is_alive=data['is_alive'],
-            regions_controlled=data['regions_controlled'],
-            capital_region_id=data['capital_region_id'],
-            turns_played=data['turns_played']
+            player_id, name, _PLAYER_TYPES[player_type], color, score, is_alive,
+            set(regions_controlled), capital_region_id, turns_played
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Capital:
     """
     Represents a capital region with special rules.
@@ -166,17 +190,11 @@ class Capital:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Capital:
         """Create capital from dictionary."""
-        return cls(
-            region_id=data['region_id'],
-            owner_id=data['owner_id'],
-            current_hp=data['current_hp'],
-            max_hp=data['max_hp'],
-            turns_since_last_attack=data['turns_since_last_attack'],
-            is_destroyed=data['is_destroyed'],
-        )
+        # Every field is a plain JSON value, so the dict maps straight onto the constructor
+        return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Region:
     """
     Represents a territory/region on the map.
@@ -184,7 +202,7 @@ class Region:
 
     region_id: int
     name: str
-    position: Tuple[float, float]  # (x, y) coordinates for display
+    position: Sequence[float]  # (x, y) coordinates for display; a list when loaded from a save
     owner_id: Optional[int] = None  # None = neutral/unoccupied
     region_type: RegionType = RegionType.NORMAL
     fortification: FortificationLevel = FortificationLevel.NONE
@@ -193,11 +211,22 @@ class Region:
     has_been_captured: bool = False  # Whether captured in battle before
     original_owner: Optional[int] = None  # First owner (for point tracking)
     is_selectable: bool = False  # For UI highlighting during selection
+    adjacent_set: FrozenSet[int] = field(init=False, repr=False, compare=False)  # For O(1) lookups
+    # Game state holding this region (set by GameState.add_region), told about neighbour changes
+    _state: Optional[GameState] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate region data after initialization."""
         if self.original_owner is None and self.owner_id is not None:
             self.original_owner = self.owner_id
+        self.adjacent_set = frozenset(self.adjacent_regions)
+
+    def set_adjacent_regions(self, region_ids: List[int]) -> None:
+        """Replace the region's neighbours, keeping the lookup set and game state in sync."""
+        self.adjacent_regions = region_ids
+        self.adjacent_set = frozenset(region_ids)
+        if self._state is not None:
+            self._state.bump_adjacency_version()
 
     def fortify(self) -> bool:
         """
@@ -238,10 +267,10 @@ class Region:
 
     def is_adjacent_to(self, other_region_id: int) -> bool:
         """Check if this region is adjacent to another region."""
-        return other_region_id in self.adjacent_regions
+        return other_region_id in self.adjacent_set
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert region to serializable dictionary."""
+        """Convert region to serializable dictionary (adjacent_regions is shared, not copied)."""
         return {
             'region_id': self.region_id,
             'name': self.name,
@@ -249,7 +278,7 @@ class Region:
             'owner_id': self.owner_id,
             'region_type': self.region_type.name,
             'fortification': self.fortification.name,
-            'adjacent_regions': self.adjacent_regions.copy(),
+            'adjacent_regions': self.adjacent_regions,
             'point_value': self.point_value,
             'has_been_captured': self.has_been_captured,
             'original_owner': self.original_owner,
@@ -259,22 +288,16 @@ class Region:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Region:
         """Create region from dictionary."""
+        (region_id, name, position, owner_id, region_type, fortification, adjacent_regions,
+         point_value, has_been_captured, original_owner, is_selectable) = _region_fields(data)
         return cls(
-            region_id=data['region_id'],
-            name=data['name'],
-            position=tuple(data['position']),
-            owner_id=data['owner_id'],
-            region_type=RegionType[data['region_type']],
-            fortification=FortificationLevel[data['fortification']],
-            adjacent_regions=data['adjacent_regions'],
-            point_value=data['point_value'],
-            has_been_captured=data['has_been_captured'],
-            original_owner=data['original_owner'],
-            is_selectable=data['is_selectable']
+            region_id, name, position, owner_id,
+            _REGION_TYPES[region_type], _FORTIFICATION_LEVELS[fortification], adjacent_regions,
+            point_value, has_been_captured, original_owner, is_selectable
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleResult:
     """Represents the result of a battle."""
 
@@ -288,6 +311,15 @@ class BattleResult:
     defender_bonus_awarded: bool = False
     region_captured: bool = False
 
+    def reset(self) -> None:
+        """Clear the outcome so the same record can be reused for another round."""
+        self.attacker_correct = None
+        self.defender_correct = None
+        self.open_answer_ranking = None
+        self.winner_id = None
+        self.defender_bonus_awarded = False
+        self.region_captured = False
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert battle result to serializable dictionary."""
         return {
@@ -308,7 +340,7 @@ class BattleResult:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """
     Main game state container.
@@ -319,6 +351,7 @@ class GameState:
     players: Dict[int, Player] = field(default_factory=dict[int, Player])
     regions: Dict[int, Region] = field(default_factory=dict[int, Region])
     capitals: Dict[int, Capital] = field(default_factory=dict[int, Capital])  # key: region_id
+    damaged_capitals: Set[int] = field(default_factory=set[int])  # Capitals below max HP (can regenerate)
 
     # Game state
     current_phase: GamePhase = GamePhase.SETUP
@@ -337,14 +370,46 @@ class GameState:
     occupation_regions_remaining: List[int] = field(default_factory=list[int])  # Region IDs available
 
     # Game history
-    battle_history: List[BattleResult] = field(default_factory=list[BattleResult])
+    battle_history: Deque[BattleResult] = field(
+        default_factory=lambda: deque(maxlen=BATTLE_HISTORY_LIMIT)
+    )  # Most recent battles only
     turn_history: List[Dict[str, Any]] = field(default_factory=list[dict[str, Any]])
 
     # Metadata
-    game_id: str = field(default_factory=lambda: datetime.now().strftime("%Y%m%d_%H%M%S"))
+    game_id: str = field(default_factory=lambda: f"{time.time_ns():x}")  # Hex nanosecond timestamp
     created_at: datetime = field(default_factory=datetime.now)
     config_hash: str = ""  # Hash of game config for validation
 
+    # Bumped whenever ownership, fortification, capitals or adjacency change (keys derived caches)
+    version: int = field(default=0, init=False, compare=False)
+    # Bumped when regions are added or rewired with Region.set_adjacent_regions
+    adjacency_version: int = field(default=0, init=False, compare=False)
+
+    # Region ids and positions as arrays (same order), rebuilt lazily when regions change
+    _region_ids: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _region_positions: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _region_index: Dict[int, int] = field(default_factory=dict[int, int], init=False, repr=False, compare=False)
+
+    # Border targets per player, tagged with the version they were built at
+    _border_cache: Dict[int, Tuple[int, FrozenSet[int]]] = field(
+        default_factory=dict[int, Tuple[int, FrozenSet[int]]], init=False, repr=False, compare=False
+    )
+
+    # Region ids per owner (None = unoccupied); set_region_owner keeps it in sync,
+    # any other version bump makes it rebuild on next use
+    _owner_index: Dict[Optional[int], Set[int]] = field(
+        default_factory=dict[Optional[int], Set[int]], init=False, repr=False, compare=False
+    )
+    _owner_index_version: int = field(default=-1, init=False, repr=False, compare=False)
+
+    # Occupation split per player, tagged with the version it was built at
+    _occupation_cache: Dict[int, Tuple[int, Tuple[List[Region], List[Region]]]] = field(
+        default_factory=dict[int, Tuple[int, Tuple[List[Region], List[Region]]]],
+        init=False, repr=False, compare=False
+    )
+    # Alive player ids in join order, tagged with the version they were built at
+    _alive_cache: Optional[Tuple[int, Tuple[int, ...]]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Initialize derived structures."""
         # Ensure capitals dict stays in sync
@@ -352,23 +417,78 @@ class GameState:
 
     def _sync_capitals(self) -> None:
         """Ensure capitals dict is consistent with regions."""
-        # Remove capitals for regions that don't exist or aren't capitals
-        region_ids_to_remove: List[int] = []
-        for region_id, _ in self.capitals.items():
-            if (region_id not in self.regions or
-                self.regions[region_id].region_type != RegionType.CAPITAL):
-                region_ids_to_remove.append(region_id)
+        # Keep only capitals whose region exists and is a capital
+        regions = self.regions
+        self.capitals = {
+            region_id: capital for region_id, capital in self.capitals.items()
+            if region_id in regions and regions[region_id].region_type == RegionType.CAPITAL
+        }
+
+    def bump_version(self) -> None:
+        """Record a change to ownership, fortification or capitals."""
+        self.version += 1
+
+    def bump_adjacency_version(self) -> None:
+        """Record a change to the map's adjacency (also invalidates version-keyed caches)."""
+        self.adjacency_version += 1
+        self.version += 1
+
+    def _get_owner_index(self) -> Dict[Optional[int], Set[int]]:
+        """Get the owner index, rebuilding it if the state changed since it was built."""
+        if self._owner_index_version != self.version:
+            index: Dict[Optional[int], Set[int]] = {}
+            for region_id, region in self.regions.items():
+                index.setdefault(region.owner_id, set()).add(region_id)
+            self._owner_index = index
+            self._owner_index_version = self.version
+        return self._owner_index
+
+    def get_region_ids_by_owner(self, owner_id: Optional[int]) -> Set[int]:
+        """
+        Get IDs of regions owned by a player.
+
+        Args:
+            owner_id: Owner to look up, or None for unoccupied regions
+
+        Returns:
+            Set of region IDs (shared with the index, do not modify)
+        """
+        return self._get_owner_index().get(owner_id, set())
+
+    def set_region_owner(self, region_id: int, owner_id: Optional[int]) -> None:
+        """
+        Change a region's owner and update the owner index in place.
+        Player.regions_controlled, points and fortification are left to the caller.
 
-        for region_id in region_ids_to_remove:
-            del self.capitals[region_id]
+        Args:
+            region_id: Region changing hands
+            owner_id: New owner, or None to make it unoccupied
+        """
+        index = self._get_owner_index()
+        region = self.regions[region_id]
+        old_ids = index.get(region.owner_id)
+        if old_ids is not None:
+            old_ids.discard(region_id)
+        index.setdefault(owner_id, set()).add(region_id)
+        region.owner_id = owner_id
+
+        self.version += 1
+        self._owner_index_version = self.version
 
     def add_player(self, player: Player) -> None:
         """Add a player to the game."""
         self.players[player.player_id] = player
+        self.version += 1
 
     def add_region(self, region: Region) -> None:
         """Add a region to the game."""
+        # Re-sync the lookup set in case the neighbour list was edited after construction
+        region.adjacent_set = frozenset(region.adjacent_regions)
+        region._state = self
         self.regions[region.region_id] = region
+        self._region_ids = None  # Region arrays are rebuilt on next use
+        self.version += 1
+        self.adjacency_version += 1
 
         # If it's a capital, create corresponding Capital object
         if region.region_type == RegionType.CAPITAL and region.owner_id is not None:
@@ -378,17 +498,84 @@ class GameState:
             )
             self.capitals[region.region_id] = capital
 
+    def get_region_arrays(self) -> Tuple[np.ndarray, np.ndarray, Dict[int, int]]:
+        """
+        Get region ids and positions as NumPy arrays for vectorized distance checks.
+
+        Returns:
+            Tuple of (region ids, (N, 2) positions, region_id -> row in the arrays)
+        """
+        regions = self.regions
+        if self._region_ids is None or len(self._region_ids) != len(regions):
+            self._region_ids = np.fromiter(regions.keys(), dtype=np.int64, count=len(regions))
+            self._region_positions = np.array(
+                [region.position for region in regions.values()], dtype=np.float64
+            ).reshape(-1, 2)
+            self._region_index = {region_id: i for i, region_id in enumerate(regions)}
+        return self._region_ids, self._region_positions, self._region_index
+
+    def distances_from(self, region_id: int) -> np.ndarray:
+        """
+        Get the distance from one region to every region.
+
+        Args:
+            region_id: Region to measure from
+
+        Returns:
+            Distances in the same order as the ids from get_region_arrays()
+        """
+        _, positions, region_index = self.get_region_arrays()
+        origin = positions[region_index[region_id]]
+        return np.hypot(positions[:, 0] - origin[0], positions[:, 1] - origin[1])
+
     def get_player_regions(self, player_id: int) -> List[Region]:
         """Get all regions controlled by a player."""
         player = self.players.get(player_id)
         if not player:
             return []
 
-        regions_list: List[Region] = []
+        regions = self.regions
+        return [regions[region_id] for region_id in player.regions_controlled if region_id in regions]
+
+    def get_border_targets(self, player_id: int) -> FrozenSet[int]:
+        """
+        Get IDs of enemy regions adjacent to any of the player's regions.
+        The set is cached until the state version changes.
+
+        Args:
+            player_id: Player to check for
+
+        Returns:
+            Set of region IDs the player can attack
+        """
+        cached = self._border_cache.get(player_id)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        player = self.players.get(player_id)
+        if not player:
+            return frozenset()
+
+        regions = self.regions
+
+        # Union of all neighbours first, so shared borders are only checked once
+        neighbour_ids: Set[int] = set()
         for region_id in player.regions_controlled:
-            if region_id in self.regions:
-                regions_list.append(self.regions[region_id])
-        return regions_list
+            region = regions.get(region_id)
+            if region is not None:
+                neighbour_ids |= region.adjacent_set
+
+        targets: Set[int] = set()
+        for adjacent_id in neighbour_ids:
+            adjacent_region = regions.get(adjacent_id)
+            if (adjacent_region is not None and
+                adjacent_region.owner_id is not None and
+                adjacent_region.owner_id != player_id):
+                targets.add(adjacent_id)
+
+        border_targets = frozenset(targets)
+        self._border_cache[player_id] = (self.version, border_targets)
+        return border_targets
 
     def get_adjacent_enemy_regions(self, player_id: int) -> List[Region]:
         """
@@ -400,23 +587,7 @@ class GameState:
         Returns:
             List of enemy regions that are adjacent to player's regions
         """
-        player_regions = self.get_player_regions(player_id)
-        adjacent_enemy_regions: List[Region] = []
-        visited_region_ids: set[int] = set()
-
-        for player_region in player_regions:
-            for adjacent_id in player_region.adjacent_regions:
-                if (adjacent_id in visited_region_ids or  # Already visited
-                    adjacent_id not in self.regions):  # Region does not exist
-                    continue
-
-                adjacent_region = self.regions[adjacent_id]
-                if (adjacent_region.owner_id is not None and
-                    adjacent_region.owner_id != player_id):
-                    adjacent_enemy_regions.append(adjacent_region)
-                    visited_region_ids.add(adjacent_id)
-
-        return adjacent_enemy_regions
+        return [self.regions[region_id] for region_id in self.get_border_targets(player_id)]
 
     def get_available_regions_for_occupation(
             self, player_id: int) -> Tuple[List[Region], List[Region]]:
@@ -430,15 +601,24 @@ class GameState:
         Returns:
             List of available regions, adjacent ones first
         """
-        player = self.players.get(player_id)
-        if not player:
-            return [], []
-
-        # Get all unoccupied regions
-        unoccupied_regions: List[Region] = []
-        for region in self.regions.values():
-            if region.owner_id is None:
-                unoccupied_regions.append(region)
+        cached = self._occupation_cache.get(player_id)
+        if cached is None or cached[0] != self.version:
+            player = self.players.get(player_id)
+            if not player:
+                return [], []
+            cached = (self.version, self._split_occupation_regions(player))
+            self._occupation_cache[player_id] = cached
+
+        # Copies, so callers can't disturb the cached split
+        adjacent_regions, non_adjacent_regions = cached[1]
+        return list(adjacent_regions), list(non_adjacent_regions)
+
+    def _split_occupation_regions(self, player: Player) -> Tuple[List[Region], List[Region]]:
+        """Split unoccupied regions into those next to the player's regions and the rest."""
+        # Get all unoccupied regions (in ID order)
+        regions = self.regions
+        unoccupied_regions = [regions[region_id]
+                              for region_id in sorted(self.get_region_ids_by_owner(None))]
 
         if not player.regions_controlled:
             # Player has no regions yet (initial occupation) - return all
@@ -448,21 +628,19 @@ class GameState:
         adjacent_regions: List[Region] = []
         non_adjacent_regions: List[Region] = []
 
-        player_region_ids = set(player.regions_controlled)
+        # Neighbours of everything the player holds (adjacency is symmetric)
+        frontier: Set[int] = set()
+        for player_region_id in player.regions_controlled:
+            player_region = regions.get(player_region_id)
+            if player_region is not None:
+                frontier.update(player_region.adjacent_set)
 
         for region in unoccupied_regions:
-            is_adjacent = False
-            for player_region_id in player_region_ids:
-                if region.is_adjacent_to(player_region_id):
-                    is_adjacent = True
-                    break
-
-            if is_adjacent:
+            if region.region_id in frontier:
                 adjacent_regions.append(region)
             else:
                 non_adjacent_regions.append(region)
 
-
         # Return adjacent first, then non-adjacent
         return adjacent_regions, non_adjacent_regions
 
@@ -482,17 +660,19 @@ class GameState:
 
         # Mark player as dead
         eliminated.is_alive = False
+        self.version += 1
 
         # Transfer regions
+        regions = self.regions
         for region_id in eliminated.regions_controlled:
-            if region_id in self.regions:
-                region = self.regions[region_id]
+            region = regions.get(region_id)
+            if region is not None:
                 # Capture via capital - keep current point value
                 region.change_owner(conqueror_id, via_capital_capture=True)
-                conqueror.add_region(region_id)
 
-        # Clear player's regions
-        eliminated.regions_controlled.clear()
+        # Hand over the whole region set at once and clear the player's regions
+        conqueror.regions_controlled |= eliminated.regions_controlled
+        eliminated.regions_controlled = set()
 
         # Transfer score
         conqueror.score += eliminated.score
@@ -504,8 +684,16 @@ class GameState:
                 capital.owner_id = conqueror_id
 
     def get_alive_players(self) -> List[Player]:
-        """Get all alive players."""
-        return [p for p in self.players.values() if p.is_alive]
+        """Get all alive players (the alive set is cached until the state version changes)."""
+        cached = self._alive_cache
+        if cached is None or cached[0] != self.version:
+            alive_ids = tuple(pid for pid, p in self.players.items() if p.is_alive)
+            self._alive_cache = (self.version, alive_ids)
+        else:
+            alive_ids = cached[1]
+
+        players = self.players
+        return [players[pid] for pid in alive_ids]
 
     def get_player_turn_order(self) -> List[int]:
         """
@@ -517,14 +705,14 @@ class GameState:
         """
         alive_players = self.get_alive_players()
         # Sort by score ascending (lowest first), then by player ID for tiebreaker
-        sorted_players = sorted(
-            alive_players,
-            key=lambda p: (p.score, p.player_id)
-        )
+        sorted_players = sorted(alive_players, key=attrgetter('score', 'player_id'))
         return [p.player_id for p in sorted_players]
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert game state to serializable dictionary."""
+        """
+        Convert game state to serializable dictionary.
+        Lists are shared with the state rather than copied; treat the result as read-only.
+        """
         return {
             'players': {pid: p.to_dict() for pid, p in self.players.items()},
             'regions': {rid: r.to_dict() for rid, r in self.regions.items()},
@@ -536,10 +724,10 @@ class GameState:
             'selected_region_id': self.selected_region_id,
             'current_battle': self.current_battle.to_dict() if self.current_battle else None,
             'battle_phase': self.battle_phase,
-            'occupation_ranking': self.occupation_ranking.copy(),
-            'occupation_regions_remaining': self.occupation_regions_remaining.copy(),
+            'occupation_ranking': self.occupation_ranking,
+            'occupation_regions_remaining': self.occupation_regions_remaining,
             'battle_history': [b.to_dict() for b in self.battle_history],
-            'turn_history': self.turn_history.copy(),
+            'turn_history': self.turn_history,
             'game_id': self.game_id,
             'created_at': self.created_at.isoformat(),
             'config_hash': self.config_hash,
@@ -556,14 +744,20 @@ class GameState:
 
         # Recreate regions
         for rid, r_data in data['regions'].items():
-            state.regions[int(rid)] = Region.from_dict(r_data)
+            region = Region.from_dict(r_data)
+            region._state = state
+            state.regions[int(rid)] = region
 
         # Recreate capitals
         for rid, c_data in data['capitals'].items():
             state.capitals[int(rid)] = Capital.from_dict(c_data)
+        state.damaged_capitals = {
+            rid for rid, capital in state.capitals.items()
+            if not capital.is_destroyed and capital.current_hp < capital.max_hp
+        }
 
         # Set other attributes
-        state.current_phase = GamePhase[data['current_phase']]
+        state.current_phase = _GAME_PHASES[data['current_phase']]
         state.current_player_id = data['current_player_id']
         state.current_turn = data['current_turn']
         state.max_turns_per_player = data['max_turns_per_player']
@@ -576,9 +770,10 @@ class GameState:
         state.occupation_ranking = data['occupation_ranking']
         state.occupation_regions_remaining = data['occupation_regions_remaining']
 
-        state.battle_history = [
-            BattleResult.from_dict(b) for b in data['battle_history']
-        ]
+        state.battle_history = deque(
+            (BattleResult.from_dict(b) for b in data['battle_history']),
+            maxlen=BATTLE_HISTORY_LIMIT
+        )
 
         state.turn_history = data['turn_history']
         state.game_id = data['game_id']
@@ -588,13 +783,26 @@ class GameState:
         return state
 
     def save(self, filepath: str) -> None:
-        """Save game state to file."""
+        """Save game state to file (uses orjson when it is installed)."""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.to_dict(),
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            return
+
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(self.to_dict(), f, indent=2, default=str)
 
     @classmethod
     def load(cls, filepath: str) -> GameState:
-        """Load game state from file."""
+        """Load game state from file (uses orjson when it is installed)."""
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                return cls.from_dict(orjson.loads(f.read()))
+
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
             return cls.from_dict(data)
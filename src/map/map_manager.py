@@ -1,11 +1,30 @@
 from __future__ import annotations
 import random
 import math
-from typing import List, Dict, Tuple, Set, Optional, Any
-from dataclasses import dataclass, field
+from collections import deque
+from typing import List, Deque, Dict, Tuple, Set, Optional, Sequence, Any
+from dataclasses import dataclass
+
+import numpy as np
 
 from src.game.state import Region
 
+# Base names for regions (immutable, so MapConfig instances can share it)
+_DEFAULT_REGION_NAMES: Tuple[str, ...] = (
+    "Arctic", "Tundra", "Taiga", "Forest", "Plains", "Desert",
+    "Savanna", "Jungle", "Mountains", "Hills", "Swamp", "Coast",
+    "Island", "Peninsula", "Archipelago", "Valley", "Canyon",
+    "Plateau", "Mesa", "Oasis", "Volcano", "Glacier", "Fjord",
+    "Delta", "Basin", "Cliff", "Cave", "Reef", "Lagoon", "Bay",
+    "Strait", "Isthmus", "Atoll", "Geyser", "Crater", "Summit"
+)
+
+# Suffixes for compound names once the name pool runs out
+_NAME_SUFFIXES: Tuple[str, ...] = (
+    "North", "South", "East", "West", "Upper", "Lower",
+    "New", "Old", "Greater", "Lesser", "Central"
+)
+
 
 @dataclass
 class MapConfig:
@@ -13,14 +32,7 @@ class MapConfig:
 
     region_count: int = 24
     border_margin: int = 50
-    region_names: List[str] = field(default_factory=lambda: [
-        "Arctic", "Tundra", "Taiga", "Forest", "Plains", "Desert",
-        "Savanna", "Jungle", "Mountains", "Hills", "Swamp", "Coast",
-        "Island", "Peninsula", "Archipelago", "Valley", "Canyon",
-        "Plateau", "Mesa", "Oasis", "Volcano", "Glacier", "Fjord",
-        "Delta", "Basin", "Cliff", "Cave", "Reef", "Lagoon", "Bay",
-        "Strait", "Isthmus", "Atoll", "Geyser", "Crater", "Summit"
-    ])
+    region_names: Sequence[str] = _DEFAULT_REGION_NAMES  # Shared default; pass a list to customise
 
 
 class MapManager:
@@ -84,9 +96,6 @@ class MapManager:
         # Step 6: Ensure all regions are connected
         self._ensure_connectivity(regions_data)
 
-        for region_data in regions_data:
-            region_data['adjacent'] = [adj_idx + 1 for adj_idx in region_data['adjacent']]
-
         print(f"Generated {len(regions_data)} regions in {grid_width}x{grid_height} grid")
         return regions_data
 
@@ -106,26 +115,38 @@ class MapManager:
             (grid_width, grid_height) - dimensions in number of cells
         """
         target_aspect = screen_width / screen_height
-        best_score = float('inf')
-        best_dimensions = (1, count)
 
-        # Try all possible grid dimensions
-        for width in range(1, count + 1):
+        def score(width: int) -> Tuple[float, int]:
+            """Score a grid width (lower is better); also returns its height."""
             height = (count + width - 1) // width  # Ceiling division
-
-            # Calculate how well this grid fits
-            aspect_ratio = width / height
-            aspect_diff = abs(aspect_ratio - target_aspect)
-
-            # Penalize empty cells: (width * height - count)
+            # Weight aspect ratio difference more heavily than empty cells
             empty_cells = width * height - count
+            return abs(width / height - target_aspect) * 10 + empty_cells, height
+
+        # Start from the width whose square-ish grid matches the aspect ratio
+        start_width = min(count, max(1, round(math.sqrt(count * target_aspect))))
+        best_score, start_height = score(start_width)
+        best_dimensions = (start_width, start_height)
+
+        # width / height only grows with width, so once the aspect penalty alone
+        # exceeds the best score, no wider (or, going down, narrower) grid can win.
+        # Ties go to the narrower grid.
+        for width in range(start_width + 1, count + 1):
+            height = (count + width - 1) // width
+            if (width / height - target_aspect) * 10 >= best_score:
+                break
+            width_score, height = score(width)
+            if width_score < best_score:
+                best_score = width_score
+                best_dimensions = (width, height)
 
-            # Combined score (lower is better)
-            # Weight aspect ratio difference more heavily
-            score = aspect_diff * 10 + empty_cells
-
-            if score < best_score:
-                best_score = score
+        for width in range(start_width - 1, 0, -1):
+            height = (count + width - 1) // width
+            if (target_aspect - width / height) * 10 > best_score:
+                break
+            width_score, height = score(width)
+            if width_score <= best_score:
+                best_score = width_score
                 best_dimensions = (width, height)
 
         return best_dimensions
@@ -146,7 +167,6 @@ class MapManager:
         Returns:
             List of (x, y) positions
         """
-        positions: List[Tuple[float, float]] = []
         margin = self.config.border_margin
 
         # Calculate cell size
@@ -159,30 +179,29 @@ class MapManager:
         # Calculate region radius (for non-overlapping)
         region_radius = min(cell_width, cell_height) * 0.25
 
-        # Shuffle indices to distribute regions randomly in grid
-        grid_cells = [(x, y) for x in range(grid_width) for y in range(grid_height)]
-
-        # Assign first 'count' cells to regions
-        for i in range(count):
-            grid_x, grid_y = grid_cells[i]
-
-            # Center the region in its grid cell with small random offset
-            center_x = margin + (grid_x + 0.5) * cell_width
-            center_y = margin + (grid_y + 0.5) * cell_height
-
-            # Add small random offset for natural look (but keep within cell)
-            offset_x = random.uniform(-cell_width * 0.05, cell_width * 0.05)
-            offset_y = random.uniform(-cell_height * 0.05, cell_height * 0.05)
-
-            x = center_x + offset_x
-            y = center_y + offset_y
-
-            # Ensure position stays within cell bounds
-            x = max(margin + region_radius, min(screen_width - margin - region_radius, x))
-            y = max(margin + region_radius, min(screen_height - margin - region_radius, y))
-
-            positions.append((x, y))
-
+        # Regions fill the grid column by column: region i sits at cell divmod(i, grid_height)
+        grid_xs, grid_ys = np.divmod(np.arange(count, dtype=np.float64), grid_height)
+
+        # Center the regions in their grid cells
+        center_xs = margin + (grid_xs + 0.5) * cell_width
+        center_ys = margin + (grid_ys + 0.5) * cell_height
+
+        # Small random offsets for natural look (but keep within cell). Drawn from the
+        # random module in the same x, y order as before so seeded maps are unchanged.
+        draws = np.array([random.random() for _ in range(2 * count)]).reshape(-1, 2)
+        max_offset_x = cell_width * 0.05
+        max_offset_y = cell_height * 0.05
+        xs = center_xs + (2 * max_offset_x * draws[:, 0] - max_offset_x)
+        ys = center_ys + (2 * max_offset_y * draws[:, 1] - max_offset_y)
+
+        # Ensure positions stay within cell bounds (clamp high, then low, as before)
+        min_x = min_y = margin + region_radius
+        max_x = screen_width - margin - region_radius
+        max_y = screen_height - margin - region_radius
+        xs = np.maximum(min_x, np.minimum(max_x, xs))
+        ys = np.maximum(min_y, np.minimum(max_y, ys))
+
+        positions: List[Tuple[float, float]] = list(zip(xs.tolist(), ys.tolist()))
         return positions
 
     def _generate_names(self, count: int) -> List[str]:
@@ -195,35 +214,25 @@ class MapManager:
         Returns:
             List of region names
         """
-        available_names = self.config.region_names.copy()
-        random.shuffle(available_names)
+        available_names = self.config.region_names
+        names = random.sample(available_names, min(count, len(available_names)))
 
-        # If we need more names than available, add numbers
-        names: List[str] = []
-        for i in range(count):
-            if i < len(available_names):
-                names.append(available_names[i])
-            else:
-                # Create compound names
-                base_name = random.choice(available_names)
-                suffix = random.choice(["North", "South", "East", "West",
-                                       "Upper", "Lower", "New", "Old",
-                                       "Greater", "Lesser", "Central"])
-                names.append(f"{base_name} {suffix}")
-
-        # Ensure uniqueness
-        unique_names: List[str] = []
-        name_count: Dict[str, int] = {}
+        # If we need more names than available, add compound names
+        extra = count - len(names)
+        if extra > 0:
+            base_names = random.choices(available_names, k=extra)
+            suffixes = random.choices(_NAME_SUFFIXES, k=extra)
+            names.extend(f"{base_name} {suffix}" for base_name, suffix in zip(base_names, suffixes))
 
-        for name in names:
-            if name in name_count:
-                name_count[name] += 1
-                unique_names.append(f"{name} {name_count[name]}")
-            else:
-                name_count[name] = 1
-                unique_names.append(name)
+        # Ensure uniqueness: number repeats in place
+        name_count: Dict[str, int] = {}
+        for i, name in enumerate(names):
+            seen = name_count.get(name, 0) + 1
+            name_count[name] = seen
+            if seen > 1:
+                names[i] = f"{name} {seen}"
 
-        return unique_names
+        return names
 
     def _calculate_grid_adjacency(self, count: int,
                                  grid_width: int,
@@ -238,67 +247,48 @@ class MapManager:
             grid_height: Grid height in cells
 
         Returns:
-            List of adjacency lists for each region
+            List of adjacency lists (1-based region IDs) for each region
         """
-        # Map from grid position to region index
-        grid_to_region: Dict[Tuple[int, int], int] = {}
-        region_to_grid: Dict[int, Tuple[int, int]] = {}
-
-        # First, create a list of all grid cells
-        grid_cells = [(x, y) for x in range(grid_width) for y in range(grid_height)]
-
-        # Assign first 'count' cells to regions
-        for i in range(count):
-            grid_x, grid_y = grid_cells[i]
-            grid_to_region[(grid_x, grid_y)] = i
-            region_to_grid[i] = (grid_x, grid_y)
+        # Regions fill the grid column by column: region i sits at cell divmod(i, grid_height)
+        def region_at(grid_x: int, grid_y: int) -> Optional[int]:
+            """Get the region index in a grid cell, or None if the cell is empty or off-grid."""
+            if 0 <= grid_x < grid_width and 0 <= grid_y < grid_height:
+                region_id = grid_x * grid_height + grid_y
+                if region_id < count:
+                    return region_id
+            return None
 
-        # Initialize adjacency lists
-        adjacency: List[List[int]] = [[] for _ in range(count)]
+        # Neighbours per region; dict keys act as an insertion-ordered set, so repeated
+        # links are ignored without scanning and the lists keep their original order
+        adjacency: List[Dict[int, None]] = [{} for _ in range(count)]
 
         # For each region, check its grid neighbors
         for region_id in range(count):
-            grid_x, grid_y = region_to_grid[region_id]
-
-            # Check all 4 cardinal directions
-            orthogonal_neighbors = [
-                (grid_x - 1, grid_y),  # Left
-                (grid_x + 1, grid_y),  # Right
-                (grid_x, grid_y - 1),  # Up
-                (grid_x, grid_y + 1),  # Down
-            ]
-
-            for neighbor_x, neighbor_y in orthogonal_neighbors:
-                if (neighbor_x, neighbor_y) in grid_to_region:
-                    neighbor_id = grid_to_region[(neighbor_x, neighbor_y)]
-                    # Add bidirectional connection
-                    if neighbor_id not in adjacency[region_id]:
-                        adjacency[region_id].append(neighbor_id)
-                    if region_id not in adjacency[neighbor_id]:
-                        adjacency[neighbor_id].append(region_id)
+            grid_x, grid_y = divmod(region_id, grid_height)
+
+            # Check all 4 cardinal directions: left, right, up, down
+            for neighbor_x, neighbor_y in ((grid_x - 1, grid_y), (grid_x + 1, grid_y),
+                                           (grid_x, grid_y - 1), (grid_x, grid_y + 1)):
+                neighbor_id = region_at(neighbor_x, neighbor_y)
+                if neighbor_id is not None:
+                    # Add bidirectional connection (stored as 1-based region IDs)
+                    adjacency[region_id][neighbor_id + 1] = None
+                    adjacency[neighbor_id][region_id + 1] = None
 
         # Add some random diagonal connections for more interesting maps
         for region_id in range(count):
-            grid_x, grid_y = region_to_grid[region_id]
+            grid_x, grid_y = divmod(region_id, grid_height)
 
-            # Check diagonal neighbors
-            diagonals = [
-                (grid_x - 1, grid_y - 1),  # Top-left
-                (grid_x + 1, grid_y - 1),  # Top-right
-                (grid_x - 1, grid_y + 1),  # Bottom-left
-                (grid_x + 1, grid_y + 1),  # Bottom-right
-            ]
-
-            for diag_x, diag_y in diagonals:
+            # Check diagonal neighbors: top-left, top-right, bottom-left, bottom-right
+            for diag_x, diag_y in ((grid_x - 1, grid_y - 1), (grid_x + 1, grid_y - 1),
+                                   (grid_x - 1, grid_y + 1), (grid_x + 1, grid_y + 1)):
                 if random.random() < 0.3:  # 30% chance for diagonal connection
-                    if (diag_x, diag_y) in grid_to_region:
-                        neighbor_id = grid_to_region[(diag_x, diag_y)]
-                        if neighbor_id not in adjacency[region_id]:
-                            adjacency[region_id].append(neighbor_id)
-                        if region_id not in adjacency[neighbor_id]:
-                            adjacency[neighbor_id].append(region_id)
+                    neighbor_id = region_at(diag_x, diag_y)
+                    if neighbor_id is not None:
+                        adjacency[region_id][neighbor_id + 1] = None
+                        adjacency[neighbor_id][region_id + 1] = None
 
-        return adjacency
+        return [list(neighbours) for neighbours in adjacency]
 
     def _ensure_connectivity(self, regions_data: List[Dict[str, Any]]) -> None:
         """
@@ -310,20 +300,19 @@ class MapManager:
         if not regions_data:
             return
 
-        # Use BFS to find all connected regions
-        visited: Set[int] = set()
-        queue: List[int] = [0]  # Start with region 0
+        # Use BFS to find all connected regions (marked when queued, so each is queued once).
+        # Works on list indices; adjacency holds region IDs, which are index + 1
+        visited: Set[int] = {0}  # Start with region 0
+        queue: Deque[int] = deque([0])
 
         while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-
-            visited.add(current)
+            current = queue.popleft()
 
             # Add all adjacent regions to queue
-            for neighbor in regions_data[current]['adjacent']:
+            for neighbor_id in regions_data[current]['adjacent']:
+                neighbor = neighbor_id - 1
                 if neighbor not in visited:
+                    visited.add(neighbor)
                     queue.append(neighbor)
 
         # If not all regions are connected, add connections
@@ -337,36 +326,47 @@ class MapManager:
         Connect isolated regions to the main graph.
 
         Args:
-            regions_data: List of region data dictionaries
+            regions_data: List of region data dictionaries (links are added by region ID)
             connected_set: Set of already connected region indices
         """
-        all_regions = set(range(len(regions_data)))
-        disconnected = all_regions - connected_set
-
-        while disconnected:
-            # Find closest pair between connected and disconnected
-            best_pair = None
-            best_distance = float('inf')
-
-            for conn in connected_set:
-                conn_pos = regions_data[conn]['position']
-                for disc in disconnected:
-                    disc_pos = regions_data[disc]['position']
-                    distance = self._calculate_distance(conn_pos, disc_pos)
-
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_pair = (conn, disc)
-
-            if best_pair:
-                conn, disc = best_pair
-                # Add bidirectional connection
-                regions_data[conn]['adjacent'].append(disc)
-                regions_data[disc]['adjacent'].append(conn)
-
-                # Move disc from disconnected to connected
-                disconnected.remove(disc)
-                connected_set.add(disc)
+        count = len(regions_data)
+        connected = np.zeros(count, dtype=bool)
+        connected[list(connected_set)] = True
+
+        # Squared distances between every pair, computed once (same ordering as distances)
+        positions = np.array([region_data['position'] for region_data in regions_data], dtype=np.float64)
+        diff = positions[:, None, :] - positions[None, :, :]
+        distances_sq = (diff * diff).sum(axis=-1)
+
+        # Nearest connected region for every region, updated as regions join (as in Prim's
+        # algorithm) so each step is one pass over the regions rather than over all pairs
+        connected_rows = np.flatnonzero(connected)
+        connected_distances = distances_sq[connected_rows]
+        nearest = connected_rows[connected_distances.argmin(axis=0)]
+        nearest_sq = connected_distances.min(axis=0)
+
+        while not connected.all():
+            # Find closest pair between connected and disconnected; ties go to the
+            # lowest connected index, then the lowest disconnected one
+            disconnected_cols = np.flatnonzero(~connected)
+            candidate_sq = nearest_sq[disconnected_cols]
+            tied = disconnected_cols[candidate_sq == candidate_sq.min()]
+            disc = int(tied[nearest[tied].argmin()])
+            conn = int(nearest[disc])
+
+            # Add bidirectional connection
+            regions_data[conn]['adjacent'].append(regions_data[disc]['id'])
+            regions_data[disc]['adjacent'].append(regions_data[conn]['id'])
+
+            # Move disc from disconnected to connected
+            connected[disc] = True
+            connected_set.add(disc)
+
+            # The new region may now be the closest connected one for others
+            disc_sq = distances_sq[disc]
+            closer = (disc_sq < nearest_sq) | ((disc_sq == nearest_sq) & (disc < nearest))
+            nearest = np.where(closer, disc, nearest)
+            nearest_sq = np.where(closer, disc_sq, nearest_sq)
 
     def _calculate_distance(self, pos1: Tuple[float, float],
                            pos2: Tuple[float, float]) -> float:
@@ -380,7 +380,21 @@ class MapManager:
         Returns:
             Distance
         """
-        return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+        return math.sqrt(self._calculate_distance_sq(pos1, pos2))
+
+    def _calculate_distance_sq(self, pos1: Tuple[float, float],
+                              pos2: Tuple[float, float]) -> float:
+        """
+        Calculate squared Euclidean distance between two points.
+
+        Args:
+            pos1: First position (x, y)
+            pos2: Second position (x, y)
+
+        Returns:
+            Squared distance
+        """
+        return (pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2
 
     def find_path(self, start_region_id: int, end_region_id: int,
                  regions: Dict[int, Region]) -> Optional[List[int]]:
@@ -399,26 +413,27 @@ class MapManager:
             end_region_id not in regions):
             return None
 
-        # BFS for shortest path
-        visited: Set[int] = set()
-        queue: List[Tuple[int, List[int]]] = [(start_region_id, [start_region_id])]
+        # BFS for shortest path; parent doubles as the visited set (marked when queued)
+        parent: Dict[int, Optional[int]] = {start_region_id: None}
+        queue: Deque[int] = deque([start_region_id])
 
         while queue:
-            current_id, path = queue.pop(0)
+            current_id = queue.popleft()
 
             if current_id == end_region_id:
+                # Walk back to the start to rebuild the path
+                path: List[int] = []
+                node: Optional[int] = current_id
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                path.reverse()
                 return path
 
-            if current_id in visited:
-                continue
-
-            visited.add(current_id)
-            current_region = regions[current_id]
-
-            for neighbor_id in current_region.adjacent_regions:
-                if neighbor_id not in visited and neighbor_id in regions:
-                    new_path = path + [neighbor_id]
-                    queue.append((neighbor_id, new_path))
+            for neighbor_id in regions[current_id].adjacent_regions:
+                if neighbor_id not in parent and neighbor_id in regions:
+                    parent[neighbor_id] = current_id
+                    queue.append(neighbor_id)
 
         return None
 
@@ -436,9 +451,14 @@ class MapManager:
         Returns:
             Region ID at position, or None if no region found
         """
+        # Compare squared distances to skip the sqrt
+        x, y = position
+        radius_sq = radius * radius
         for region_id, region in regions.items():
-            distance = self._calculate_distance(position, region.position)
-            if distance < radius:
+            region_x, region_y = region.position
+            dx = x - region_x
+            dy = y - region_y
+            if dx * dx + dy * dy < radius_sq:
                 return region_id
         return None
 
@@ -460,12 +480,13 @@ if __name__ == "__main__":
 
     # Check for overlaps
     positions = [data['position'] for data in regions_data]
-    min_distance = float('inf')
+    min_distance_sq = float('inf')
 
     for i in range(len(positions)):
         for j in range(i + 1, len(positions)):
-            dist = manager._calculate_distance(positions[i], positions[j])
-            min_distance = min(min_distance, dist)
+            dist_sq = manager._calculate_distance_sq(positions[i], positions[j])
+            min_distance_sq = min(min_distance_sq, dist_sq)
+    min_distance = math.sqrt(min_distance_sq)
 
     print(f"Minimum distance between regions: {min_distance:.1f} pixels")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import List, Dict, Any
+import bisect
 import json
 from pathlib import Path
 
@@ -19,6 +20,8 @@ class CategoryManager:
         self.config_path = config_path
         self.categories: List[str] = []
         self.category_groups: Dict[str, List[str]] = {}
+        self._categories_set: frozenset[str] = frozenset()
+        self._categories_sorted = False
         self._load_categories()
 
     def _load_categories(self) -> None:
@@ -45,6 +48,10 @@ class CategoryManager:
             self._create_default_categories()
             self._save_categories()
 
+        self._categories_set = frozenset(self.categories)
+        # Loaded lists keep their file order until the first add sorts them
+        self._categories_sorted = False
+
     def _create_default_categories(self) -> None:
         """Create default categories."""
         self.categories = [
@@ -100,7 +107,7 @@ class CategoryManager:
         Returns:
             Validated list of categories (only those that exist)
         """
-        valid_categories = set(self.categories)
+        valid_categories = self._categories_set
         return [cat for cat in selected_categories if cat in valid_categories]
 
     def get_category_group(self, group_name: str) -> List[str]:
@@ -125,9 +132,14 @@ class CategoryManager:
         Returns:
             True if added, False if already exists
         """
-        if category not in self.categories:
-            self.categories.append(category)
-            self.categories.sort()
+        if category not in self._categories_set:
+            if self._categories_sorted:
+                bisect.insort(self.categories, category)
+            else:
+                self.categories.append(category)
+                self.categories.sort()
+                self._categories_sorted = True
+            self._categories_set = frozenset(self.categories)
             self._save_categories()
             return True
         return False
@@ -142,8 +154,9 @@ class CategoryManager:
         Returns:
             True if removed, False if not found
         """
-        if category in self.categories:
+        if category in self._categories_set:
             self.categories.remove(category)
+            self._categories_set = frozenset(self.categories)
 
             # Remove from all groups
             for group_categories in self.category_groups.values():
@@ -168,10 +181,8 @@ class CategoryManager:
         if mode == "include":
             return self.validate_categories(selected)
         elif mode == "exclude":
-            all_cats = set(self.categories)
-            excluded = set(selected)
-            included = all_cats - excluded
-            return sorted(list(included))
+            included = self._categories_set.difference(selected)
+            return sorted(included)
         else:
             return self.categories.copy()
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Any
+from dataclasses import dataclass, field
+from typing import List, Any, Optional
 from enum import Enum, auto
 
 
@@ -10,7 +10,7 @@ class QuestionType(Enum):
     OPEN_ANSWER = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """
     Represents a trivia question.
@@ -23,6 +23,7 @@ class Question:
     correct_answer: Any  # String for MC, number for Open Answer
     options: List[str]  # Empty for Open Answer
     difficulty: int = 1  # Difficulty level 1-5 (1=easiest, 5=hardest)
+    numeric_answer: Optional[float] = field(default=None, init=False, repr=False, compare=False)  # Open Answer only
 
     def __post_init__(self) -> None:
         """Validate question data."""
@@ -34,7 +35,7 @@ class Question:
         elif self.question_type == QuestionType.OPEN_ANSWER:
             # For open answer, correct_answer should be numeric
             try:
-                float(self.correct_answer)
+                self.numeric_answer = float(self.correct_answer)
             except (ValueError, TypeError):
                 raise ValueError(f"Open answer questions must have numeric answers. Got: {self.correct_answer}")
 
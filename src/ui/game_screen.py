@@ -5,7 +5,7 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from src.utils.config import GameConfig
-from src.game.state import GameState, GamePhase, Player, Region, RegionType, Capital
+from src.game.state import GameState, GamePhase, Player, PlayerType, Region, RegionType, Capital
 from src.utils.helpers import draw_text, draw_button, is_point_in_circle
 
 
@@ -288,7 +288,7 @@ class GameScreen:
 
             # Player name
             name_text = player.name
-            if player.player_type.name == "HUMAN":
+            if player.player_type == PlayerType.HUMAN:
                 name_text += " (You)"
 
             draw_text(self.screen, name_text,
@@ -414,7 +414,7 @@ class GameScreen:
             return
 
         # Instruction based on player type
-        if current_player.player_type.name == "HUMAN":
+        if current_player.player_type == PlayerType.HUMAN:
             instruction = "Click on a region to select it, then choose an action"
             draw_text(self.screen, instruction,
                      (self.config.screen_width // 2, self.config.screen_height - 20),
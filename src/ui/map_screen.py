@@ -3,7 +3,7 @@ import pygame
 from typing import Dict, Tuple
 
 from src.utils.config import GameConfig
-from src.game.state import GameState, Region
+from src.game.state import GameState, PlayerType, Region, RegionType
 from src.utils.helpers import draw_text
 
 
@@ -183,7 +183,7 @@ class MapScreen:
 
             # Draw border
             border_color = self.colors.region_border
-            if region.region_type.name == "CAPITAL":
+            if region.region_type == RegionType.CAPITAL:
                 border_color = self.colors.capital_highlight
                 pygame.draw.circle(self.screen, border_color,
                                  (int(screen_x), int(screen_y)),
@@ -235,7 +235,7 @@ class MapScreen:
 
             # Player name
             name = player.name
-            if player.player_type.name == "HUMAN":
+            if player.player_type == PlayerType.HUMAN:
                 name += " (You)"
 
             draw_text(self.screen, name,
@@ -164,6 +164,10 @@ class GameConfig:
         "tiny": 12,
     })
 
+    # ===== DEBUG SETTINGS =====
+    verbose: bool = False  # Log per-turn and per-battle details
+    headless: bool = False  # Simulation mode: every player is AI, no think time or UI waits
+
     # ===== PATHS =====
     data_dir: str = "data"
     assets_dir: str = "assets"
@@ -255,8 +259,11 @@ class GameConfig:
         Get AI think time in milliseconds based on difficulty.
 
         Returns:
-            Think time in milliseconds
+            Think time in milliseconds (always 0 in headless mode)
         """
+        if self.headless:
+            return 0
+
         time_range = self.ai_think_time_ranges.get(self.difficulty, (1500, 2500))
         return random.randint(time_range[0], time_range[1])
 
@@ -273,6 +280,8 @@ class GameConfig:
             'screen_height': self.screen_height,
             'fullscreen': self.fullscreen,
             'fps': self.fps,
+            'verbose': self.verbose,
+            'headless': self.headless,
         }
 
     @classmethod
@@ -301,6 +310,10 @@ class GameConfig:
             config.fullscreen = data['fullscreen']
         if 'fps' in data:
             config.fps = data['fps']
+        if 'verbose' in data:
+            config.verbose = data['verbose']
+        if 'headless' in data:
+            config.headless = data['headless']
 
         config.__post_init__()  # Re-validate
         return config
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import pygame
-import math
 from typing import Tuple, List, Any
 from dataclasses import is_dataclass, asdict
 
@@ -80,8 +79,9 @@ def is_point_in_circle(point: Tuple[float, float],
     Returns:
         True if point is inside circle
     """
-    distance = math.sqrt((point[0] - center[0]) ** 2 + (point[1] - center[1]) ** 2)
-    return distance <= radius
+    dx = point[0] - center[0]
+    dy = point[1] - center[1]
+    return dx * dx + dy * dy <= radius * radius
 
 
 def is_point_in_rect(point: Tuple[float, float], rect: pygame.Rect) -> bool:
@@ -189,20 +189,23 @@ def wrap_text(text: str, font: pygame.font.Font, max_width: float) -> List[str]:
     Returns:
         List of wrapped lines
     """
-    words = text.split(' ')
+    # Measure each word once and track the line width by addition
+    space_width = font.size(' ')[0]
     lines: List[str] = []
     current_line: List[str] = []
+    current_width = 0
 
-    for word in words:
-        current_line.append(word)
-        test_text = ' '.join(current_line)
-        width, _ = font.size(test_text)
+    for word in text.split(' '):
+        word_width = font.size(word)[0]
+        new_width = current_width + space_width + word_width if current_line else word_width
 
-        if width > max_width:
-            current_line.pop()  # Remove the last word
-            if current_line:
-                lines.append(' '.join(current_line))
+        if current_line and new_width > max_width:
+            lines.append(' '.join(current_line))
             current_line = [word]
+            current_width = word_width
+        else:
+            current_line.append(word)
+            current_width = new_width
 
     if current_line:
         lines.append(' '.join(current_line))
@@ -5,8 +5,8 @@ import unittest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.game.state import (
-    GameState,  Player, PlayerType, Region,
-    FortificationLevel
+    GameState,  GamePhase, Player, PlayerType, Region, RegionType,
+    BattleResult, FortificationLevel
 )
 from src.game.logic import GameLogic
 from src.trivia.question import Question, QuestionType
@@ -228,6 +228,28 @@ class TestGameLogicBattle(unittest.TestCase):
         assert result.open_answer_ranking == [0, 1]
         assert result.open_answer_ranking[0] == 0  # Attacker is first
 
+    def test_damaged_capital_regenerates(self) -> None:
+        """Test a damaged capital regenerates after three quiet turns."""
+        self.state.add_region(Region(
+            region_id=5,
+            name="Capital",
+            position=(0, 0),
+            owner_id=1,
+            region_type=RegionType.CAPITAL
+        ))
+        capital = self.state.capitals[5]
+        result = BattleResult(attacker_id=0, defender_id=1, region_id=5, winner_id=0)
+
+        assert self.logic.execute_capital_attack(0, 5, result) is False
+        assert capital.current_hp == capital.max_hp - 1
+        assert 5 in self.state.damaged_capitals
+
+        for _ in range(3):
+            self.logic.update_capital_regeneration()
+
+        assert capital.current_hp == capital.max_hp
+        assert 5 not in self.state.damaged_capitals
+
 
 class TestGameLogicValidation(unittest.TestCase):
     """Test validation functions in GameLogic."""
@@ -382,6 +404,22 @@ class TestGameLogicCalculations(unittest.TestCase):
         distance = self.logic.calculate_distance((0, 0), (300, 400))
         assert abs(distance - 500.0) < 0.001
 
+    def test_game_over_highest_score_wins(self) -> None:
+        """Test the highest scoring player wins once turns run out."""
+        for player_id, score in enumerate([-200, -50, -100]):
+            self.state.add_player(Player(
+                player_id=player_id,
+                name=f"Player{player_id}",
+                player_type=PlayerType.AI,
+                color=(25, 118, 210),
+                score=score
+            ))
+        assert self.logic.check_game_over() is None
+
+        self.state.current_phase = GamePhase.TURN
+        self.state.current_turn = self.state.max_turns_per_player * 3 + 1
+        assert self.logic.check_game_over() == 1
+
 
 def run_tests() -> None:
     """Run all tests."""
@@ -0,0 +1,66 @@
+import sys
+import os
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.trivia.category_manager import CategoryManager
+
+
+class TestCategoryManager(unittest.TestCase):
+    """Test category validation and editing in CategoryManager."""
+
+    def setUp(self) -> None:
+        """Set up a category manager backed by a temporary config file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config_path = os.path.join(self.temp_dir.name, "categories.json")
+        self.manager = CategoryManager(self.config_path)
+
+    def test_validate_categories(self) -> None:
+        """Test unknown categories are dropped and order is kept."""
+        self.assertEqual(
+            self.manager.validate_categories(["History", "Fake Category", "Geography"]),
+            ["History", "Geography"]
+        )
+
+    def test_add_and_remove_category(self) -> None:
+        """Test validation follows categories being added and removed."""
+        self.assertTrue(self.manager.add_category("Astronomy"))
+        self.assertFalse(self.manager.add_category("Astronomy"))
+        self.assertEqual(self.manager.validate_categories(["Astronomy"]), ["Astronomy"])
+
+        self.assertTrue(self.manager.remove_category("Astronomy"))
+        self.assertFalse(self.manager.remove_category("Astronomy"))
+        self.assertEqual(self.manager.validate_categories(["Astronomy"]), [])
+
+        self.assertTrue(self.manager.remove_category("Geography"))
+        self.assertNotIn("Geography", self.manager.get_category_group("Academic"))
+
+    def test_added_categories_are_sorted(self) -> None:
+        """Test adding categories keeps the list in sorted order."""
+        for category in ("Zoology", "Astronomy", "Mythology"):
+            self.manager.add_category(category)
+
+        categories = self.manager.get_all_categories()
+        self.assertEqual(categories, sorted(categories))
+        self.assertEqual(len(categories), len(set(categories)))
+
+    def test_filtered_categories_exclude(self) -> None:
+        """Test exclude mode returns the remaining categories sorted."""
+        expected = sorted(set(self.manager.get_all_categories()) - {"Geography", "History"})
+        self.assertEqual(
+            self.manager.get_filtered_categories("exclude", ["Geography", "History"]),
+            expected
+        )
+
+    def test_categories_persist(self) -> None:
+        """Test added categories are loaded by a new manager."""
+        self.manager.add_category("Astronomy")
+        reloaded = CategoryManager(self.config_path)
+        self.assertEqual(reloaded.validate_categories(["Astronomy"]), ["Astronomy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
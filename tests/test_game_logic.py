@@ -1,5 +1,6 @@
 import sys
 import os
+import tempfile
 import unittest
 
 # Add parent directory to path
@@ -123,6 +124,147 @@ class TestGameState(unittest.TestCase):
         retrieved = self.state.players.get(99999)
         self.assertIsNone(retrieved)
 
+    def test_get_border_targets(self) -> None:
+        """Test border targets include only adjacent enemy regions."""
+        for player_id in (0, 1):
+            self.state.add_player(Player(
+                player_id=player_id,
+                name=f"Player{player_id}",
+                player_type=PlayerType.AI,
+                color=(25, 118, 210)
+            ))
+        self.state.add_region(Region(1, "Home", (0.0, 0.0), owner_id=0, adjacent_regions=[2, 3]))
+        self.state.add_region(Region(2, "Enemy", (1.0, 0.0), owner_id=1, adjacent_regions=[1, 4]))
+        self.state.add_region(Region(3, "Empty", (0.0, 1.0), adjacent_regions=[1]))
+        self.state.add_region(Region(4, "Far", (2.0, 0.0), owner_id=1, adjacent_regions=[2]))
+        self.state.players[0].add_region(1)
+        self.state.players[1].add_region(2)
+        self.state.players[1].add_region(4)
+
+        self.assertEqual(self.state.get_border_targets(0), {2})
+        self.assertEqual(self.state.get_border_targets(1), {1})
+        self.assertEqual(self.state.get_border_targets(99), set())
+
+        # Cached targets follow neighbours unlinked in place
+        self.state.regions[1].set_adjacent_regions([3])
+        self.state.regions[2].set_adjacent_regions([4])
+        self.assertEqual(self.state.get_border_targets(0), set())
+        self.assertEqual(self.state.get_border_targets(1), set())
+
+    def test_set_region_owner_updates_occupation(self) -> None:
+        """Test occupation queries follow ownership changes."""
+        self.state.add_player(Player(
+            player_id=0,
+            name="Player0",
+            player_type=PlayerType.AI,
+            color=(25, 118, 210)
+        ))
+        self.state.add_region(Region(1, "Home", (0.0, 0.0), adjacent_regions=[2]))
+        self.state.add_region(Region(2, "Next", (1.0, 0.0), adjacent_regions=[1, 3]))
+        self.state.add_region(Region(3, "Far", (2.0, 0.0), adjacent_regions=[2]))
+        self.assertEqual(self.state.get_region_ids_by_owner(None), {1, 2, 3})
+
+        self.state.set_region_owner(1, 0)
+        self.state.players[0].add_region(1)
+        self.assertEqual(self.state.regions[1].owner_id, 0)
+        self.assertEqual(self.state.get_region_ids_by_owner(0), {1})
+
+        adjacent, other = self.state.get_available_regions_for_occupation(0)
+        self.assertEqual([region.region_id for region in adjacent], [2])
+        self.assertEqual([region.region_id for region in other], [3])
+
+        # The cached split is refreshed once ownership changes
+        self.state.set_region_owner(2, 0)
+        self.state.players[0].add_region(2)
+        adjacent, other = self.state.get_available_regions_for_occupation(0)
+        self.assertEqual([region.region_id for region in adjacent], [3])
+        self.assertEqual(other, [])
+
+        # Rewiring the map refreshes the split too
+        self.state.regions[2].set_adjacent_regions([1])
+        self.state.regions[3].set_adjacent_regions([])
+        adjacent, other = self.state.get_available_regions_for_occupation(0)
+        self.assertEqual(adjacent, [])
+        self.assertEqual([region.region_id for region in other], [3])
+
+        # Direct writes are picked up after a version bump
+        self.state.regions[3].owner_id = 0
+        self.state.bump_version()
+        self.assertEqual(self.state.get_region_ids_by_owner(None), set())
+
+    def test_turn_order_lowest_score_first(self) -> None:
+        """Test turn order sorts by score, breaking ties by player ID."""
+        for player_id, score in ((0, 1500), (1, 900), (2, 1500), (3, 700)):
+            self.state.add_player(Player(
+                player_id=player_id,
+                name=f"Player{player_id}",
+                player_type=PlayerType.AI,
+                color=(25, 118, 210),
+                score=score
+            ))
+
+        self.assertEqual(self.state.get_player_turn_order(), [3, 1, 0, 2])
+
+    def test_save_and_load_round_trip(self) -> None:
+        """Test a saved game loads back with the same players and regions."""
+        self.state.add_player(Player(
+            player_id=0,
+            name="Player0",
+            player_type=PlayerType.HUMAN,
+            color=(25, 118, 210),
+            score=700
+        ))
+        self.state.add_region(Region(1, "Home", (0.0, 0.0), owner_id=0, adjacent_regions=[2]))
+        self.state.add_region(Region(2, "Next", (1.0, 0.0), adjacent_regions=[1]))
+        self.state.players[0].add_region(1)
+        self.state.current_phase = GamePhase.BATTLE
+        self.state.battle_history.append(BattleResult(attacker_id=0, defender_id=1, region_id=2))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, "save.json")
+            self.state.save(filepath)
+            loaded = GameState.load(filepath)
+
+        self.assertEqual(loaded.current_phase, GamePhase.BATTLE)
+        self.assertEqual(loaded.players[0].score, 700)
+        self.assertEqual(loaded.players[0].regions_controlled, {1})
+        self.assertEqual(loaded.regions[1].owner_id, 0)
+        self.assertTrue(loaded.regions[2].is_adjacent_to(1))
+        self.assertEqual(tuple(loaded.regions[2].position), (1.0, 0.0))
+        self.assertEqual(tuple(loaded.players[0].color), (25, 118, 210))
+        self.assertEqual(loaded.created_at, self.state.created_at)
+        self.assertEqual(len(loaded.battle_history), 1)
+        self.assertEqual(loaded.battle_history[0].region_id, 2)
+        self.assertEqual(loaded.battle_history.maxlen, self.state.battle_history.maxlen)
+
+    def test_eliminate_player_transfers_territory(self) -> None:
+        """Test elimination hands regions, score and capitals to the conqueror."""
+        for player_id in (0, 1):
+            self.state.add_player(Player(
+                player_id=player_id,
+                name=f"Player{player_id}",
+                player_type=PlayerType.AI,
+                color=(25, 118, 210),
+                score=1000
+            ))
+        self.state.add_region(Region(1, "Home", (0.0, 0.0), owner_id=0))
+        self.state.add_region(Region(2, "Capital", (1.0, 0.0), owner_id=1, region_type=RegionType.CAPITAL))
+        self.state.add_region(Region(3, "Field", (2.0, 0.0), owner_id=1))
+        self.state.players[0].add_region(1)
+        self.state.players[1].add_region(2)
+        self.state.players[1].add_region(3)
+        self.assertEqual(len(self.state.get_alive_players()), 2)
+
+        self.state.eliminate_player(1, 0)
+
+        self.assertFalse(self.state.players[1].is_alive)
+        self.assertEqual([p.player_id for p in self.state.get_alive_players()], [0])
+        self.assertEqual(self.state.players[0].regions_controlled, {1, 2, 3})
+        self.assertEqual(self.state.players[1].regions_controlled, set())
+        self.assertEqual(self.state.regions[3].owner_id, 0)
+        self.assertEqual(self.state.players[0].score, 2000)
+        self.assertEqual(self.state.capitals[2].owner_id, 0)
+
 
 class TestRegion(unittest.TestCase):
     """Test the Region class."""
@@ -201,6 +343,21 @@ class TestGameLogic(unittest.TestCase):
         distance = self.logic.calculate_distance(pos, pos)
         self.assertAlmostEqual(distance, 0.0)
 
+    def test_distances_from_matches_scalar(self) -> None:
+        """Test GameState.distances_from agrees with the scalar calculation."""
+        for region_id, position in enumerate([(3.0, 4.0), (0.0, 0.0), (-6.0, 8.0)], start=1):
+            self.state.add_region(Region(region_id, f"R{region_id}", position))
+
+        _, _, region_index = self.state.get_region_arrays()
+        distances = self.state.distances_from(2)
+
+        self.assertEqual(len(distances), 3)
+        for region_id, region in self.state.regions.items():
+            self.assertAlmostEqual(
+                distances[region_index[region_id]],
+                self.logic.calculate_distance((0.0, 0.0), region.position)
+            )
+
     def test_can_attack_own_region_fails(self) -> None:
         """Test that player cannot attack their own region."""
         # Add player and setup
@@ -333,6 +490,80 @@ class TestGameLogic(unittest.TestCase):
         can_fortify = self.logic.can_fortify_region(player_id, 1)
         self.assertFalse(can_fortify)
 
+    def test_available_actions_refresh_after_fortify(self) -> None:
+        """Test cached available actions are rebuilt after the state changes."""
+        player = Player(
+            player_id=0,
+            name="Player1",
+            player_type=PlayerType.HUMAN,
+            color=(25, 118, 210)
+        )
+        self.state.add_player(player)
+        self.state.add_region(Region(region_id=1, name="Home", position=(100.0, 100.0), owner_id=0))
+        player.add_region(1)
+
+        self.assertEqual(self.logic.get_available_actions(0)['fortify'], [1])
+        self.assertTrue(self.logic.fortify_region(0, 1))
+        self.assertEqual(self.logic.get_available_actions(0)['fortify'], [])
+
+    def test_available_actions_refresh_after_rewiring(self) -> None:
+        """Test cached attack targets drop a neighbour that is unlinked in place."""
+        for player_id in (0, 1):
+            self.state.add_player(Player(
+                player_id=player_id,
+                name=f"Player{player_id}",
+                player_type=PlayerType.AI,
+                color=(25, 118, 210)
+            ))
+        region_a = Region(1, "A", (0.0, 0.0), owner_id=0, adjacent_regions=[2])
+        region_b = Region(2, "B", (1.0, 0.0), owner_id=1, adjacent_regions=[1])
+        self.state.add_region(region_a)
+        self.state.add_region(region_b)
+        self.state.players[0].add_region(1)
+        self.state.players[1].add_region(2)
+        self.assertEqual(self.logic.get_available_actions(0)['attack'], [2])
+
+        region_a.set_adjacent_regions([])
+        region_b.set_adjacent_regions([])
+        self.assertEqual(self.logic.get_available_actions(0)['attack'], [])
+
+    def test_validate_game_state(self) -> None:
+        """Test validation reports owner mismatches and one-way adjacency."""
+        player = Player(
+            player_id=0,
+            name="Player1",
+            player_type=PlayerType.HUMAN,
+            color=(25, 118, 210)
+        )
+        self.state.add_player(player)
+        self.state.add_region(Region(1, "A", (0.0, 0.0), owner_id=0, adjacent_regions=[2]))
+        self.state.add_region(Region(2, "B", (1.0, 0.0), adjacent_regions=[1, 3]))
+        self.state.add_region(Region(3, "C", (2.0, 0.0), adjacent_regions=[]))
+        player.add_region(1)
+        self.assertEqual(len(self.logic.validate_game_state()), 1)  # 2->3 is one-way
+
+        player.add_region(2)
+        errors = self.logic.validate_game_state()
+        self.assertEqual(len(errors), 2)
+        self.assertIn("owner mismatch", errors[0])
+        self.assertIn("not symmetric", errors[1])
+
+    def test_validate_game_state_after_rewiring(self) -> None:
+        """Test the adjacency check is redone when neighbours change in place."""
+        region_a = Region(1, "A", (0.0, 0.0), adjacent_regions=[2])
+        region_b = Region(2, "B", (1.0, 0.0), adjacent_regions=[1])
+        self.state.add_region(region_a)
+        self.state.add_region(region_b)
+        self.assertEqual(self.logic.validate_game_state(), [])
+
+        region_a.set_adjacent_regions([])
+        errors = self.logic.validate_game_state()
+        self.assertEqual(len(errors), 1)
+        self.assertIn("not symmetric", errors[0])
+
+        region_b.set_adjacent_regions([])
+        self.assertEqual(self.logic.validate_game_state(), [])
+
 
 class TestBattleResult(unittest.TestCase):
     """Test the BattleResult class."""
@@ -358,6 +589,21 @@ class TestBattleResult(unittest.TestCase):
         result.winner_id = 1
         self.assertEqual(result.winner_id, 1)
 
+    def test_battle_result_reset(self) -> None:
+        """Test resetting a battle result for another round."""
+        result = BattleResult(
+            attacker_id=1,
+            defender_id=2,
+            region_id=5
+        )
+        result.winner_id = 1
+        result.region_captured = True
+        result.reset()
+        self.assertIsNone(result.winner_id)
+        self.assertFalse(result.region_captured)
+        self.assertEqual(result.attacker_id, 1)
+        self.assertEqual(result.region_id, 5)
+
 
 class TestPlayerNameGeneration(unittest.TestCase):
     """Test player name generation."""
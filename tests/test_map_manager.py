@@ -0,0 +1,150 @@
+import sys
+import os
+import random
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.state import Region
+from src.map.map_manager import MapManager, MapConfig
+
+
+class TestMapManager(unittest.TestCase):
+    """Test map generation and path finding in MapManager."""
+
+    def setUp(self) -> None:
+        """Set up a map manager and a small line-shaped map."""
+        self.manager = MapManager(MapConfig())
+        # 1 - 2 - 3 - 4, plus 5 joined to 2 and 4, and an unreachable 6
+        self.regions = {
+            1: Region(1, "A", (0.0, 0.0), adjacent_regions=[2]),
+            2: Region(2, "B", (100.0, 0.0), adjacent_regions=[1, 3, 5]),
+            3: Region(3, "C", (200.0, 0.0), adjacent_regions=[2, 4]),
+            4: Region(4, "D", (300.0, 0.0), adjacent_regions=[3, 5]),
+            5: Region(5, "E", (200.0, 100.0), adjacent_regions=[2, 4]),
+            6: Region(6, "F", (500.0, 500.0)),
+        }
+
+    def test_generated_map_is_connected(self) -> None:
+        """Test every generated region can be reached from region 1."""
+        random.seed(7)
+        for count in (16, 24, 32):
+            regions_data = self.manager.generate_regions(count)
+            self.assertEqual(len(regions_data), count)
+
+            regions = {
+                data['id']: Region(data['id'], data['name'], data['position'],
+                                   adjacent_regions=data['adjacent'])
+                for data in regions_data
+            }
+            for region_id in regions:
+                self.assertIsNotNone(self.manager.find_path(1, region_id, regions))
+
+    def test_generated_adjacency_is_symmetric(self) -> None:
+        """Test adjacency lists are bidirectional and free of duplicates."""
+        random.seed(11)
+        regions_data = self.manager.generate_regions(24)
+        adjacency = {data['id']: data['adjacent'] for data in regions_data}
+
+        for region_id, neighbours in adjacency.items():
+            self.assertEqual(len(neighbours), len(set(neighbours)))
+            self.assertNotIn(region_id, neighbours)
+            for neighbour_id in neighbours:
+                self.assertIn(region_id, adjacency[neighbour_id])
+
+    def test_generated_names_are_unique(self) -> None:
+        """Test region names are unique, even when the name pool runs out."""
+        random.seed(3)
+        names = self.manager._generate_names(24)
+        self.assertEqual(len(names), 24)
+        self.assertEqual(len(set(names)), 24)
+        self.assertTrue(set(names) <= set(self.manager.config.region_names))
+
+        small_manager = MapManager(MapConfig(region_names=["Bay", "Cove"]))
+        names = small_manager._generate_names(20)
+        self.assertEqual(len(names), 20)
+        self.assertEqual(len(set(names)), 20)
+        self.assertEqual(sorted(names[:2]), ["Bay", "Cove"])
+
+    def test_connect_isolated_regions_uses_nearest_pairs(self) -> None:
+        """Test isolated regions are joined to their nearest connected region."""
+        regions_data = [
+            {'id': 1, 'position': (0.0, 0.0), 'adjacent': [2]},
+            {'id': 2, 'position': (100.0, 0.0), 'adjacent': [1]},
+            {'id': 3, 'position': (130.0, 40.0), 'adjacent': []},
+            {'id': 4, 'position': (-50.0, 0.0), 'adjacent': []},
+        ]
+        connected = {0, 1}
+
+        self.manager._connect_isolated_regions(regions_data, connected)
+
+        self.assertEqual(connected, {0, 1, 2, 3})
+        self.assertEqual(regions_data[2]['adjacent'], [2])
+        self.assertEqual(regions_data[3]['adjacent'], [1])
+        self.assertEqual(regions_data[0]['adjacent'], [2, 4])
+        self.assertEqual(regions_data[1]['adjacent'], [1, 3])
+
+    def test_grid_dimensions_match_exhaustive_search(self) -> None:
+        """Test the grid size equals the best width found by scoring every width."""
+        for count in range(16, 33):
+            for screen_width, screen_height in ((1280, 720), (800, 800), (720, 1280), (3840, 600)):
+                target_aspect = screen_width / screen_height
+                best_score = float('inf')
+                expected = (1, count)
+                for width in range(1, count + 1):
+                    height = (count + width - 1) // width
+                    score = abs(width / height - target_aspect) * 10 + (width * height - count)
+                    if score < best_score:
+                        best_score = score
+                        expected = (width, height)
+
+                self.assertEqual(
+                    self.manager._calculate_grid_dimensions(count, screen_width, screen_height),
+                    expected
+                )
+
+    def test_get_region_at_position(self) -> None:
+        """Test clicks inside a region's radius find it and clicks outside don't."""
+        self.assertEqual(self.manager.get_region_at_position((103.0, 4.0), self.regions), 2)
+        self.assertEqual(self.manager.get_region_at_position((200.0, 129.0), self.regions), 5)
+        self.assertIsNone(self.manager.get_region_at_position((200.0, 130.0), self.regions))
+        self.assertIsNone(self.manager.get_region_at_position((50.0, 50.0), self.regions, radius=10.0))
+
+    def test_find_path_shortest(self) -> None:
+        """Test find_path returns a shortest route."""
+        self.assertEqual(self.manager.find_path(1, 4, self.regions), [1, 2, 3, 4])
+        self.assertEqual(self.manager.find_path(1, 5, self.regions), [1, 2, 5])
+        self.assertEqual(self.manager.find_path(3, 3, self.regions), [3])
+
+    def test_find_path_sees_new_regions(self) -> None:
+        """Test find_path follows regions added after an earlier search."""
+        self.assertIsNone(self.manager.find_path(1, 6, self.regions))
+
+        self.regions[7] = Region(7, "G", (400.0, 300.0), adjacent_regions=[4, 6])
+        self.regions[4].adjacent_regions.append(7)
+        self.regions[6].adjacent_regions.append(7)
+        self.assertEqual(self.manager.find_path(1, 6, self.regions), [1, 2, 3, 4, 7, 6])
+
+        other_regions = {1: Region(1, "A", (0.0, 0.0))}
+        self.assertEqual(self.manager.find_path(1, 1, other_regions), [1])
+
+    def test_find_path_sees_rewired_regions(self) -> None:
+        """Test find_path follows neighbours changed in place."""
+        self.assertIsNone(self.manager.find_path(1, 6, self.regions))
+
+        self.regions[5].set_adjacent_regions([2, 4, 6])
+        self.regions[6].set_adjacent_regions([5])
+        self.assertEqual(self.manager.find_path(1, 6, self.regions), [1, 2, 5, 6])
+
+        self.regions[2].set_adjacent_regions([1, 3])
+        self.regions[5].set_adjacent_regions([4, 6])
+        self.assertEqual(self.manager.find_path(1, 6, self.regions), [1, 2, 3, 4, 5, 6])
+
+    def test_find_path_unreachable(self) -> None:
+        """Test find_path returns None when there is no route."""
+        self.assertIsNone(self.manager.find_path(1, 6, self.regions))
+        self.assertIsNone(self.manager.find_path(1, 99, self.regions))
+
+
+if __name__ == "__main__":
+    unittest.main()